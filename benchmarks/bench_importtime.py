@@ -0,0 +1,66 @@
+import os
+import re
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+# run from anywhere: the bot lives one folder up
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCRIPT = os.path.join(ROOT, "fp_newspapers.py")
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s+)(\S+)")
+
+# -X importtime of "import fp_newspapers" in a fresh interpreter: (total us, {top-level package: us})
+def import_profile():
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", "import fp_newspapers"],
+                            cwd=ROOT, capture_output=True, text=True, check=True)
+    packages, children, total = {}, {}, 0
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if not match: continue
+        cumulative, depth, module = int(match.group(2)), (len(match.group(3)) - 1) // 2, match.group(4)
+        # children are listed before their parent: depth 1 lines belong to the next depth 0 line
+        if depth == 1:
+            package = module.split(".")[0]
+            children[package] = children.get(package, 0) + cumulative
+        elif depth == 0:
+            if module == "fp_newspapers": total, packages = cumulative, children
+            children = {}
+    return total, packages
+
+# wall time from process start until --help is printed: interpreter (or bootloader) + imports
+def cold_start(command, repeats):
+    times = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        subprocess.run(command + ["--help"], cwd=ROOT, capture_output=True, check=True)
+        times.append(time.perf_counter() - started)
+    return times
+
+def report(label, times):
+    print(f"  {label:<28} median {statistics.median(times) * 1000:8.1f} ms   "
+          f"min {min(times) * 1000:8.1f} ms   ({len(times)} runs)")
+
+def main():
+    parser = argparse.ArgumentParser(description="Import time and cold start of fp_newspapers.")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per measurement")
+    parser.add_argument("--top", type=int, default=10, help="packages listed in the import summary")
+    parser.add_argument("--exe", nargs="*", default=[], help="built executables to time as well")
+    args = parser.parse_args()
+
+    runs = [import_profile() for _ in range(args.repeats)]
+    totals = [total for total, _ in runs]
+    print(f"import fp_newspapers: median {statistics.median(totals) / 1000:.1f} ms "
+          f"(min {min(totals) / 1000:.1f} ms, {len(runs)} runs)")
+    packages = runs[-1][1]
+    for name, us in sorted(packages.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {name:<28} {us / 1000:8.1f} ms")
+
+    print("\nCold start (--help):")
+    report("python fp_newspapers.py", cold_start([sys.executable, SCRIPT], args.repeats))
+    for exe in args.exe:
+        report(os.path.basename(os.path.normpath(exe)), cold_start([os.path.abspath(exe)], args.repeats))
+
+if __name__ == "__main__":
+    main()
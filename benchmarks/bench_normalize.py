@@ -0,0 +1,54 @@
+import os
+import re
+import sys
+import time
+import unicodedata
+
+# run from anywhere: the bot lives one folder up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fp_newspapers import normalize_name
+
+# titles as they show up on frontpages.gr / zougla.gr and in newspapers.csv
+TITLES = [
+    "Καθημερινή", "Τα Νέα", "Το Βήμα", "Εφημερίδα των Συντακτών", "Ελεύθερος Τύπος",
+    "Πρώτο Θέμα", "Δημοκρατία", "Εστία", "Αυγή", "Ριζοσπάστης", "Ναυτεμπορική",
+    "Απογευματινή", "Βραδυνή", "Μακεδονία", "Νέα Εγνατία", "ΝΕΑ ΕΓΝΑΤΙΑ - Θεσ/νίκη",
+    "Real News", "Documento", "Παραπολιτικά", "Φως των Σπορ", "Πρωταθλητής", "Ο Λόγος",
+    "Το Παρόν", "Έθνος", "Μπαμ", "Τύπος Θεσσαλονίκης", "Αθλητική Ηχώ", "Κόντρα News",
+    "Ελεύθερη Ώρα", "Κεφάλαιο", "Metrosport", "Livesport", "Goal News", "Sportime",
+    "Εξπρές", "Χρηματιστήριο", "Τα Νέα Σαββατοκύριακο", "Η Καθημερινή της Κυριακής",
+]
+
+# the per-character implementation normalize_name replaced, kept here as the baseline
+def legacy_normalize(text):
+    text = text.lower().strip()
+    text = ''.join(c for c in unicodedata.normalize('NFD', text)
+                   if unicodedata.category(c) != 'Mn')
+    text = re.sub(r'[^a-z0-9\sα-ω]', '', text)
+    return text.strip()
+
+def throughput(func, corpus, rounds):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        for title in corpus:
+            func(title)
+    return rounds * len(corpus) / (time.perf_counter() - start)
+
+def main(rounds=200):
+    # every listing entry and CSV row is a distinct string in practice, mix in the variants
+    corpus = TITLES + [t.upper() for t in TITLES] + [f"  {t} ({i})" for i, t in enumerate(TITLES)]
+    for title in corpus:
+        assert normalize_name(title) == legacy_normalize(title), title
+
+    legacy = throughput(legacy_normalize, corpus, rounds)
+    uncached = throughput(normalize_name.__wrapped__, corpus, rounds)
+    normalize_name.cache_clear()
+    cached = throughput(normalize_name, corpus, rounds)
+
+    print(f"Corpus: {len(corpus)} titles x {rounds} rounds")
+    print(f"  before (per-char + re.sub):  {legacy:>12,.0f} names/s")
+    print(f"  after, cache miss:           {uncached:>12,.0f} names/s  ({uncached / legacy:.1f}x)")
+    print(f"  after, memoized:             {cached:>12,.0f} names/s  ({cached / legacy:.1f}x)")
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200)
@@ -0,0 +1,225 @@
+import os
+import io
+import re
+import sys
+import json
+import time
+import random
+import argparse
+import tempfile
+import threading
+import contextlib
+import statistics
+from datetime import datetime, date
+from concurrent.futures import ProcessPoolExecutor
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+# run from anywhere: the bot lives one folder up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fp_newspapers import NewspaperBot
+
+# recorded pages, shared with the parser tests: frontpages.html, zougla.html,
+# zougla_detail.html, cover.jpg and recorded.json (the day they were saved)
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests", "fixtures")
+STAGES = ("run", "lookup", "index.frontpages", "index.zougla", "download", "pdf")
+SYLLABLES = ["κα", "θη", "με", "ρι", "νη", "τα", "νε", "βη", "μα", "ε", "στι", "αυ", "γη", "ρι", "ζο",
+             "σπα", "στης", "δη", "μο", "κρα", "τι", "α", "λο", "γος", "πρω", "το", "θε", "φως", "σπορ"]
+
+# --- Site fixtures ---
+# pseudo-Greek titles that do not share words, so fuzzy matching is not fooled by the corpus
+def make_titles(count, seed=7):
+    rng = random.Random(seed)
+    titles = set()
+    while len(titles) < count:
+        word = lambda n: "".join(rng.choice(SYLLABLES) for _ in range(n))
+        titles.add(f"{word(3).capitalize()} {word(2).capitalize()}")
+    return sorted(titles)
+
+def make_cover():
+    from PIL import Image
+    buffer = io.BytesIO()
+    Image.effect_noise((800, 1100), 40).convert("RGB").save(buffer, "JPEG", quality=80)
+    return buffer.getvalue()
+
+# 70% of the titles are on frontpages.gr, 20% only on zougla.gr, 10% nowhere
+def make_site(titles):
+    today = datetime.now()
+    thumbers, blocks = [], []
+    for i, title in enumerate(titles):
+        if i % 10 < 7:
+            thumbers.append(f'<div class="thumber"><div class="paperName"><a href="#">{title}</a></div>'
+                            f'<div class="paperdate">{today.day}/{today.month}</div>'
+                            f'<img src="covers/{i}300.jpg"></div>')
+        elif i % 10 < 9:
+            blocks.append(f'<div class="newspaper-block"><div class="front-img"><a href="detail/{i}">'
+                          f'<img src="covers/{i}s.jpg"></a></div><div class="newspaper-info">'
+                          f'<strong>{title}</strong> {today:%d/%m/%Y}</div></div>')
+    page = '<html><head><meta charset="utf-8"></head><body>{}</body></html>'
+    return {
+        "/fp/": page.format("".join(thumbers)).encode("utf-8"),
+        "/zg/": page.format("".join(blocks)).encode("utf-8"),
+        "detail": page.format('<div class="newspaper-cover"><img src="../covers/{cover}.jpg"></div>'),
+    }
+
+def load_recorded():
+    pages = {}
+    with open(os.path.join(FIXTURES_DIR, "recorded.json"), encoding='utf-8') as f:
+        recorded = date.fromisoformat(json.load(f)["date"])
+    for key, name in (("/fp/", "frontpages.html"), ("/zg/", "zougla.html"), ("detail", "zougla_detail.html")):
+        with open(os.path.join(FIXTURES_DIR, name), encoding='utf-8') as f:
+            html = f.read()
+        pages[key] = html if key == "detail" else move_to_today(html, recorded).encode("utf-8")
+    with open(os.path.join(FIXTURES_DIR, "cover.jpg"), 'rb') as f:
+        cover = f.read()
+    return pages, cover
+
+# the listings carry the day they were saved, shifted to today so the bot does not skip
+# every cover as old. entries of other days stay as they are
+def move_to_today(html, recorded):
+    today = datetime.now()
+    day_month = rf"\b0?{recorded.day}/0?{recorded.month}"
+    html = re.sub(rf"{day_month}/{recorded.year}\b", f"{today:%d/%m/%Y}", html)
+    return re.sub(rf"{day_month}\b(?!/)", f"{today.day}/{today.month}", html)
+
+# the recorded listings only know their own papers, the CSV cycles through them
+def recorded_titles(pages, size):
+    bot = NewspaperBot(engine="http", pause=False, application_path=tempfile.mkdtemp())
+    names = [entry["name"].strip() for source, key in (("frontpages", "/fp/"), ("zougla", "/zg/"))
+             for entry in bot.sources_by_name[source].parse_entries(pages[key]) if entry["name"]]
+    return [names[i % len(names)] for i in range(size)]
+
+# saves the live pages once, with absolute site links made root-relative so they hit the stand-in
+def record():
+    import requests
+    from urllib.parse import urljoin
+    bot = NewspaperBot(engine="http", pause=False, application_path=tempfile.mkdtemp())
+    os.makedirs(FIXTURES_DIR, exist_ok=True)
+    origins = ("https://www.frontpages.gr", "https://www.zougla.gr")
+    def save(name, url):
+        html = requests.get(url, timeout=30).text
+        for origin in origins:
+            html = html.replace(origin, "")
+        with open(os.path.join(FIXTURES_DIR, name), 'w', encoding='utf-8') as f:
+            f.write(html)
+        return html
+    save("frontpages.html", bot.url_frontpages)
+    zougla = save("zougla.html", bot.url_zougla)
+    source = bot.sources_by_name["zougla"]
+    detail_url = source.detail_url(source.parse_entries(zougla)[0]["url"])
+    cover_url = urljoin(detail_url, source.parse_cover(save("zougla_detail.html", detail_url)))
+    with open(os.path.join(FIXTURES_DIR, "cover.jpg"), 'wb') as f:
+        f.write(requests.get(cover_url, timeout=30).content)
+    with open(os.path.join(FIXTURES_DIR, "recorded.json"), 'w', encoding='utf-8') as f:
+        json.dump({"date": date.today().isoformat()}, f)
+        f.write("\n")
+    print(f"✅ Recorded fixtures in {FIXTURES_DIR}")
+
+# --- Local HTTP stand-in ---
+def serve(pages, cover, latency, bandwidth):
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            time.sleep(latency)
+            path = self.path.split("?")[0]
+            if path in pages:
+                body, kind = pages[path], "text/html; charset=utf-8"
+            elif path.endswith(".jpg"):
+                body, kind = cover, "image/jpeg"
+            else:
+                # any other page is a zougla detail page, the number picks its cover
+                number = path.rstrip("/").rsplit("/", 1)[-1]
+                body, kind = pages["detail"].replace("{cover}", number).encode("utf-8"), "text/html; charset=utf-8"
+            self.send_response(200)
+            self.send_header("Content-Type", kind)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            # bandwidth is in bytes per second, 0 means unlimited
+            chunk = 16 * 1024
+            for start in range(0, len(body), chunk):
+                self.wfile.write(body[start:start + chunk])
+                if bandwidth: time.sleep(chunk / bandwidth)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+# --- Runs ---
+# runs in its own process, so the peak RSS belongs to this size alone
+def bench_size(size, titles, base_url, engine, repeats):
+    runs = []
+    for _ in range(repeats):
+        with tempfile.TemporaryDirectory() as app_dir:
+            with open(os.path.join(app_dir, "newspapers.csv"), 'w', encoding='utf-8') as f:
+                f.write("NewspaperName\n" + "\n".join(titles) + "\n")
+            bot = NewspaperBot(engine=engine, application_path=app_dir, pause=False)
+            bot.url_frontpages = base_url + "fp/"
+            bot.url_zougla = base_url + "zg/"
+            started = time.perf_counter()
+            with contextlib.redirect_stdout(io.StringIO()):
+                bot.run()
+            runs.append({"wall": time.perf_counter() - started,
+                         "stages": {name: sum(times) for name, times in bot.stats.spans.items()},
+                         "covers": len(bot.downloaded_images)})
+    try:
+        import resource
+        # kilobytes on Linux, bytes on macOS
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        peak_mb = peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+    except ImportError:
+        peak_mb = None
+    return {"size": size, "runs": runs, "peak_rss_mb": peak_mb}
+
+def percentile(values, q):
+    if len(values) == 1: return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+def report(result):
+    runs = result["runs"]
+    total = sum(run["wall"] for run in runs)
+    peak = f"{result['peak_rss_mb']:.0f} MB" if result["peak_rss_mb"] is not None else "n/a"
+    print(f"\n📊 {result['size']} titles: {len(runs) / total:.2f} runs/s, "
+          f"{runs[0]['covers']} covers per run, peak RSS {peak}")
+    for stage in STAGES:
+        times = [run["stages"][stage] for run in runs if stage in run["stages"]]
+        if not times: continue
+        print(f"    {stage:<18} p50 {percentile(times, 50) * 1000:8.1f} ms   "
+              f"p90 {percentile(times, 90) * 1000:8.1f} ms   p99 {percentile(times, 99) * 1000:8.1f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark NewspaperBot against a local stand-in of the sites.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000], help="CSV sizes to run")
+    parser.add_argument("--repeats", type=int, default=5, help="runs per CSV size")
+    parser.add_argument("--engine", default="http", help="engine passed to NewspaperBot")
+    parser.add_argument("--latency-ms", type=float, default=20, help="delay before every response")
+    parser.add_argument("--bandwidth-kbps", type=float, default=0, help="per-connection bandwidth, 0 is unlimited")
+    parser.add_argument("--recorded", action="store_true", help=f"serve the recorded pages in {FIXTURES_DIR}")
+    parser.add_argument("--record", action="store_true", help="record the live pages as fixtures and exit")
+    args = parser.parse_args()
+
+    if args.record:
+        record()
+        return
+
+    cover = None
+    if args.recorded:
+        pages, cover = load_recorded()
+    for size in args.sizes:
+        if args.recorded:
+            titles = recorded_titles(pages, size)
+        else:
+            titles = make_titles(size)
+            pages, cover = make_site(titles), cover or make_cover()
+        server = serve(pages, cover, args.latency_ms / 1000, args.bandwidth_kbps * 1024)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}/"
+        try:
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                result = pool.submit(bench_size, size, titles, base_url, args.engine, args.repeats).result()
+        finally:
+            server.shutdown()
+        report(result)
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,23 @@ import os
 import re
 import time
 import unicodedata
-import requests
 import csv 
-from urllib.parse import urljoin
-from datetime import datetime
-from playwright.sync_api import sync_playwright
-from PIL import Image
+import json
+import shutil
+import hashlib
+import sqlite3
+import functools
+import argparse
+import io
+import threading
+import multiprocessing
+import contextlib
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from urllib.parse import urljoin, urlparse
+from datetime import datetime, date
+
+# the heavy packages (playwright, requests, bs4, PIL, img2pdf, pikepdf, numpy, sklearn)
+# are imported by the stage that needs them, so the exe starts and checks its CSV quickly
 
 # helps to get the path of resources when bundled with PyInstaller
 def resource_path(relative_path):
@@ -22,10 +33,785 @@ def resource_path(relative_path):
         # helps create paths relative to the script location
     return os.path.join(base_path, relative_path)
 
-class NewspaperBot:
+# cleanse to only alphanumeric and spaces (including Greek letters). After NFD the accents
+# are separate combining marks outside this class, so the same pass strips them too
+NORMALIZE_STRIP = re.compile(r'[^a-z0-9\sα-ω]')
+
+# names repeat across listings, CSV rows, manifest and PDF lookups, so results are memoized
+@functools.lru_cache(maxsize=4096)
+def normalize_name(text):
+    return NORMALIZE_STRIP.sub('', unicodedata.normalize('NFD', text.lower().strip())).strip()
+
+# scores every target against every listing name with one sparse matrix product over
+# character n-gram TF-IDF vectors (rows are L2-normalized, so the product is the cosine).
+# returns {target: listing name} for pairs scoring at least threshold. the assignment is
+# one-to-one: the strongest pairs are taken first and every listing name serves one target.
+# targets in skip only take part in the vectors, they never get a match
+def fuzzy_match(names, targets, threshold, skip=()):
+    if not names or not targets: return {}
+    import numpy as np
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    vectorizer = TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 3))
+    # fitting on both sides keeps target n-grams the listing lacks in the score
+    vectorizer.fit(list(names) + list(targets))
+    scores = (vectorizer.transform(targets) @ vectorizer.transform(names).T).toarray()
+    matches, taken = {}, set()
+    for flat in np.argsort(scores, axis=None, kind="stable")[::-1]:
+        row, column = divmod(int(flat), len(names))
+        if scores[row, column] < threshold: break
+        if targets[row] in matches or targets[row] in skip or column in taken: continue
+        matches[targets[row]] = names[column]
+        taken.add(column)
+    return matches
+
+# in-page extractor: one evaluate call returns every listing entry as {name, date, url},
+# the selectors come from the Source
+ENTRIES_JS = """
+(els, s) => els.map(el => {
+    const name = el.querySelector(s.name);
+    const date = s.date ? el.querySelector(s.date) : null;
+    const link = el.querySelector(s.link);
+    return {
+        name: name ? name.textContent : null,
+        date: date ? date.textContent : "",
+        url: link ? link.getAttribute(s.attr) : null,
+    };
+})
+"""
+
+COVER_JS = "els => els.length ? els[0].getAttribute('src') : null"
+
+# covers are placed at 300 dpi, the page size PIL used to produce
+PDF_DPI = (300, 300)
+
+# dashboard copies of every cover: each width in each format, as derivatives/<name>_<width>.<ext>
+DERIVATIVE_WIDTHS = (300, 1200)
+DERIVATIVE_FORMATS = {"jpeg": ("jpg", 85), "webp": ("webp", 80), "avif": ("avif", 60)}
+
+# downloads go to <file>.part first: reads between 64 KB and 1 MB, a few resumes per
+# transfer, and nothing larger than any real cover
+DOWNLOAD_CHUNK_MIN = 64 * 1024
+DOWNLOAD_CHUNK_MAX = 1024 * 1024
+DOWNLOAD_RESUMES = 3
+MAX_COVER_BYTES = 50 * 1024 * 1024
+
+# a source that fails this many times in a row is skipped, one retry after the cooldown.
+# the startup probe only waits for the response headers, it says up or down and nothing
+# about how long a page takes. adapted timeouts never go below the floor, a full (not
+# --lean) browser navigation waits for every image and script, so it gets a higher one
+BREAKER_THRESHOLD = 3
+BREAKER_COOLDOWN = 60
+PROBE_TIMEOUT = 5
+TIMEOUT_FLOOR = 10.0
+FULL_NAVIGATION_FLOOR = 30.0
+
+# http engine: each lower-priority listing starts this many seconds after the one before it,
+# so a preferred listing that already has every title saves the rest from being fetched
+PREFETCH_STAGGER = 0.5
+
+# files the archive keeps uncompressed, their formats are compressed already
+ARCHIVE_STORED = (".jpg", ".jpeg", ".png", ".webp", ".avif", ".pdf")
+
+# a cover whose bytes match an earlier day of the same title is stale. otherwise only the
+# last STALE_WINDOW_DAYS are compared, and a 256-bit pHash at most STALE_HASH_DISTANCE bits
+# away counts as the same cover (re-encoded or resized copies land within ~6 bits, different
+# front pages of the same paper 40+ bits apart)
+STALE_WINDOW_DAYS = 7
+STALE_HASH_DISTANCE = 16
+HASH_SIZE = 16
+
+# lean navigation: only the HTML and scripts of the sites are loaded, the page is used
+# as soon as the DOM and the entries are there, and every site has its own time budget
+LEAN_BLOCKED_RESOURCES = ("image", "media", "font", "stylesheet")
+
+# launch order of the browser channels, None is Playwright's bundled Chromium
+BROWSER_CHANNELS = ("chrome", "msedge", None)
+CHANNEL_LABELS = {"chrome": "Google Chrome", "msedge": "Microsoft Edge", None: "bundled Chromium"}
+
+# scraping engines: drive a real browser, or fetch static HTML and parse it with lxml
+ENGINES = ("playwright", "http", "async")
+USER_AGENT = ("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+              "(KHTML, like Gecko) Chrome/131.0 Safari/537.36")
+
+class Source:
+    # one site that lists newspaper covers, described by CSS selectors:
+    #   entry_selector   one element per paper on the listing page
+    #   name_selector, date_selector, link_selector (+ link_attr)   inside every entry
+    #   date_pattern     regex that picks the date out of the date text (group 1)
+    #   thumb_suffix     replaced by full_suffix to turn the thumbnail into the high-res URL
+    #   cover_selector   when set, the link is a detail page and this finds the cover on it
+    # lower priority numbers win when several sources have the same paper
+    def __init__(self, name, listing_url, entry_selector, name_selector, link_selector, link_attr="src",
+                 label=None, priority=50, suffix=None, date_selector=None, date_pattern=None,
+                 thumb_suffix=None, full_suffix="", cover_selector=None, timeout=30000, enabled=True):
+        self.name = name
+        self.label = label or name
+        self.listing_url = listing_url
+        self.priority = priority
+        self.suffix = suffix or name
+        self.entry_selector = entry_selector
+        self.name_selector = name_selector
+        self.date_selector = date_selector
+        self.date_pattern = date_pattern
+        self.link_selector = link_selector
+        self.link_attr = link_attr
+        self.thumb_suffix = thumb_suffix
+        self.full_suffix = full_suffix
+        self.cover_selector = cover_selector
+        self.timeout = timeout
+        self.enabled = enabled
+
+    # argument of ENTRIES_JS
+    @property
+    def selectors(self):
+        return {"name": self.name_selector, "date": self.date_selector,
+                "link": self.link_selector, "attr": self.link_attr}
+
+    # static counterpart of ENTRIES_JS, same selectors and the same {name, date, url}
+    def parse_entries(self, html):
+        from bs4 import BeautifulSoup
+        entries = []
+        for el in BeautifulSoup(html, "lxml").select(self.entry_selector):
+            name = el.select_one(self.name_selector)
+            date = el.select_one(self.date_selector) if self.date_selector else None
+            link = el.select_one(self.link_selector)
+            entries.append({
+                "name": name.get_text() if name else None,
+                "date": date.get_text() if date else "",
+                "url": link.get(self.link_attr) if link else None,
+            })
+        return entries
+
+    def parse_date(self, text):
+        if not self.date_pattern: return text
+        match = re.search(self.date_pattern, text)
+        return match.group(1) if match else ""
+
+    # high-res URL for sources that link the cover from the listing itself
+    def cover_url(self, url):
+        if self.thumb_suffix:
+            if not url.endswith(self.thumb_suffix): return None
+            # Convert small image URL to high-res image URL
+            url = url.replace(self.thumb_suffix, self.full_suffix)
+        return urljoin(self.listing_url, url)
+
+    def detail_url(self, url):
+        return urljoin(self.listing_url, url)
+
+    def parse_cover(self, html):
+        from bs4 import BeautifulSoup
+        img = BeautifulSoup(html, "lxml").select_one(self.cover_selector)
+        return img.get("src") if img else None
+
+# the two sites the bot started with, sources.json can change them or add more
+BUILTIN_SOURCES = (
+    dict(name="frontpages", label="Frontpages.gr", listing_url="https://www.frontpages.gr/", priority=0,
+         suffix="fp", entry_selector=".thumber", name_selector=".paperName a", date_selector=".paperdate",
+         link_selector="img", link_attr="src", thumb_suffix="300.jpg", full_suffix="I.jpg"),
+    dict(name="zougla", label="Zougla.gr", listing_url="https://www.zougla.gr/newspapers/", priority=1,
+         suffix="zg", entry_selector=".newspaper-block", name_selector=".newspaper-info strong",
+         date_selector=".newspaper-info", date_pattern=r'(\d{2}/\d{2}/\d{4})',
+         link_selector=".front-img a", link_attr="href", cover_selector=".newspaper-cover img"),
+)
+
+# built-in sources updated/extended by a JSON list of Source fields, matched by "name"
+def load_sources(config_path):
+    configs = {config["name"]: dict(config) for config in BUILTIN_SOURCES}
+    if os.path.exists(config_path):
+        try:
+            with open(config_path, encoding='utf-8') as f:
+                extra = json.load(f)
+            for config in extra:
+                configs.setdefault(config["name"], {}).update(config)
+            print(f"✅ Loaded {len(extra)} source settings from {os.path.basename(config_path)}")
+        except Exception as e:
+            print(f"⚠️ Could not read {os.path.basename(config_path)}, using the built-in sources: {e}")
+    sources = []
+    for config in configs.values():
+        try:
+            sources.append(Source(**config))
+        except TypeError as e:
+            print(f"⚠️ Skipping source '{config.get('name')}': {e}")
+    return sorted(sources, key=lambda source: source.priority)
+
+# runs in a worker process: one decode per cover, JPEGs are decoded at reduced scale
+# (draft mode) just large enough for the biggest width. returns the number of files written
+def make_derivatives(path, out_dir, widths=DERIVATIVE_WIDTHS, formats=tuple(DERIVATIVE_FORMATS)):
+    from PIL import Image
+    stem = os.path.splitext(os.path.basename(path))[0]
+    targets = [(width, fmt, os.path.join(out_dir, f"{stem}_{width}.{DERIVATIVE_FORMATS[fmt][0]}"))
+               for width in sorted(widths, reverse=True) for fmt in formats]
+    # outputs newer than the cover are left alone on reruns
+    source_time = os.path.getmtime(path)
+    targets = [target for target in targets
+               if not (os.path.exists(target[2]) and os.path.getmtime(target[2]) >= source_time)]
+    if not targets: return 0
+    with Image.open(path) as img:
+        largest = targets[0][0]
+        img.draft("RGB", (largest, largest * img.height // img.width))
+        img = img.convert("RGB")
+        written = 0
+        for width in dict.fromkeys(target[0] for target in targets):
+            if width < img.width:
+                # widths go from large to small, each resize starts from the previous one
+                img = img.resize((width, max(1, round(img.height * width / img.width))), Image.LANCZOS)
+            for target_width, fmt, target_path in targets:
+                if target_width != width: continue
+                img.save(target_path, fmt.upper(), quality=DERIVATIVE_FORMATS[fmt][1])
+                written += 1
+    return written
+
+# 256-bit perceptual hash, as 32 bytes: the 16x16 lowest frequencies of the DCT of a 64x64
+# grayscale thumbnail, one bit per coefficient above their median. unlike a difference
+# hash, the blank margins and white space of a cover do not turn into noise bits
+def cover_hash(path):
+    import numpy as np
+    from PIL import Image
+    size = HASH_SIZE * 4
+    with Image.open(path) as img:
+        img.draft("L", (size * 2, size * 2))
+        pixels = np.asarray(img.convert("L").resize((size, size), Image.LANCZOS), dtype=np.float64)
+    n = np.arange(size)
+    dct = np.cos(np.pi * (2 * n[None, :] + 1) * n[:HASH_SIZE, None] / (2 * size))
+    coefficients = (dct @ pixels @ dct.T).ravel()
+    # the first coefficient is the mean brightness, it stays out of the median
+    return np.packbits(coefficients > np.median(coefficients[1:]))
+
+# title part of a cover file name: "τανεα_fp.jpg" -> "τανεα", whatever the source
+def cover_key(filename):
+    return os.path.splitext(filename)[0].rsplit("_", 1)[0]
+
+class CoverHashes:
+    # sha256 and pHash (cover_hash) of every kept cover, as parallel numpy arrays in one
+    # .npz file: title key, day (date ordinal), sha256 and hash (one 32-byte row per cover).
+    # the first use hashes the earlier day folders
+    def __init__(self, path, root_dir):
+        import numpy as np
+        self.path = path
+        try:
+            with np.load(path) as data:
+                if "shas" not in data: raise ValueError("written by an older version")
+                self.keys, self.days, self.shas, self.hashes = data["keys"], data["days"], data["shas"], data["hashes"]
+        except FileNotFoundError:
+            self._scan(root_dir)
+        except Exception as e:
+            print(f"⚠️ Could not read the cover hashes, rebuilding them: {e}")
+            self._scan(root_dir)
+
+    def _scan(self, root_dir):
+        import numpy as np
+        today = date.today()
+        keys, days, shas, hashes = [], [], [], []
+        for day_name in sorted(os.listdir(root_dir)):
+            try:
+                day = datetime.strptime(day_name, '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            if day >= today: continue
+            folder = os.path.join(root_dir, day_name)
+            for filename in os.listdir(folder):
+                if not filename.lower().endswith(".jpg"): continue
+                path = os.path.join(folder, filename)
+                try:
+                    hashes.append(cover_hash(path))
+                except Exception:
+                    continue
+                shas.append(file_digest(path))
+                keys.append(cover_key(filename))
+                days.append(day.toordinal())
+        print(f"🧮 Hashed {len(hashes)} covers of earlier days")
+        self.keys = np.array(keys, dtype=str)
+        self.days = np.array(days, dtype=np.int32)
+        self.shas = np.array(shas, dtype=str)
+        self.hashes = np.array(hashes, dtype=np.uint8).reshape(-1, HASH_SIZE * HASH_SIZE // 8)
+        self.save()
+
+    # latest earlier day with the same cover of the same title as (day ordinal, "exact" or
+    # "similar"), or None. identical bytes count on any day, look-alikes only within window
+    def seen(self, key, sha, digest, day, window=STALE_WINDOW_DAYS, max_distance=STALE_HASH_DISTANCE):
+        import numpy as np
+        earlier = (self.keys == key) & (self.days < day)
+        exact = earlier & (self.shas == sha)
+        if exact.any(): return int(self.days[exact].max()), "exact"
+        recent = earlier & (self.days >= day - window)
+        if not recent.any(): return None
+        same = np.unpackbits(self.hashes[recent] ^ digest, axis=1).sum(axis=1) <= max_distance
+        return (int(self.days[recent][same].max()), "similar") if same.any() else None
+
+    # one hash per title and day, a rerun replaces it
+    def add(self, key, day, sha, digest):
+        import numpy as np
+        keep = ~((self.keys == key) & (self.days == day))
+        self.keys = np.append(self.keys[keep], key)
+        self.days = np.append(self.days[keep], np.int32(day))
+        self.shas = np.append(self.shas[keep], sha)
+        self.hashes = np.vstack([self.hashes[keep], digest])
+
+    def save(self):
+        import numpy as np
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, keys=self.keys, days=self.days, shas=self.shas, hashes=self.hashes)
+        os.replace(tmp_path, self.path)
+
+class ImageCache:
+    # downloaded covers shared by every run and --workers process, keyed by source URL.
+    # the bytes are the BlobStore's, an SQLite table adds the HTTP validators (ETag /
+    # Last-Modified) so a rerun only revalidates, plus the last use for LRU eviction
+    def __init__(self, cache_dir, blobs, max_bytes=512 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.blobs = blobs
+        self.db_path = os.path.join(cache_dir, "images.sqlite")
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+        with self._connect() as db, db:
+            db.execute("""CREATE TABLE IF NOT EXISTS images (
+                url TEXT PRIMARY KEY, sha256 TEXT, size INTEGER, etag TEXT, last_modified TEXT, used REAL)""")
+            db.execute("CREATE INDEX IF NOT EXISTS images_sha256 ON images (sha256)")
+        self._import_index(os.path.join(cache_dir, "index.json"))
+        self._import_blobs(os.path.join(cache_dir, "blobs"))
+
+    def _connect(self):
+        # one short-lived connection per call, like ListingCache
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        return contextlib.closing(db)
+
+    # the index.json of earlier versions is taken over once
+    def _import_index(self, index_path):
+        if not os.path.exists(index_path): return
+        try:
+            with open(index_path, encoding='utf-8') as f:
+                entries = json.load(f)
+            with self._connect() as db, db:
+                db.executemany("INSERT OR IGNORE INTO images VALUES (?, ?, ?, ?, ?, ?)",
+                               [(url, e["sha256"], e["size"], e.get("etag"), e.get("last_modified"), e.get("used", 0))
+                                for url, e in entries.items()])
+            os.remove(index_path)
+        except Exception as e:
+            print(f"⚠️ Could not take over the old image cache index: {e}")
+
+    # earlier versions kept their own copy of the bytes in .cache/blobs
+    def _import_blobs(self, blob_dir):
+        if not os.path.isdir(blob_dir): return
+        try:
+            for digest in os.listdir(blob_dir):
+                self.blobs.adopt(os.path.join(blob_dir, digest), digest)
+            os.rmdir(blob_dir)
+        except Exception as e:
+            print(f"⚠️ Could not move the old cached covers into the blob store: {e}")
+
+    def _blob_path(self, digest):
+        return self.blobs.path(digest)
+
+    # sha256 of every cached cover, their blobs stay when no day folder needs them
+    def digests(self):
+        with self._connect() as db:
+            return {row[0] for row in db.execute("SELECT DISTINCT sha256 FROM images")}
+
+    def _entry(self, db, url):
+        return db.execute("SELECT sha256, etag, last_modified FROM images WHERE url = ?", (url,)).fetchone()
+
+    # headers for a conditional GET, empty when the URL was never cached
+    def validators(self, url):
+        with self._connect() as db:
+            entry = self._entry(db, url)
+        if not entry or not os.path.exists(self._blob_path(entry[0])): return {}
+        headers = {}
+        if entry[1]: headers["If-None-Match"] = entry[1]
+        if entry[2]: headers["If-Modified-Since"] = entry[2]
+        return headers
+
+    # places the cached bytes of url at save_path after a 304, returns the sha256 or None
+    def restore(self, url, save_path):
+        with self._connect() as db, db:
+            entry = self._entry(db, url)
+            if not entry: return None
+            blob = self._blob_path(entry[0])
+            if not os.path.exists(blob): return None
+            if not (os.path.exists(save_path) and os.path.samefile(blob, save_path)):
+                if os.path.exists(save_path): os.remove(save_path)
+                _link_or_copy(blob, save_path)
+            db.execute("UPDATE images SET used = ? WHERE url = ?", (time.time(), url))
+        return entry[0]
+
+    # remembers a fresh download together with its validators, save_path becomes a link
+    # to the blob of its bytes
+    def store(self, url, save_path, digest, headers):
+        self.blobs.put(save_path, digest)
+        with self._connect() as db, db:
+            db.execute("INSERT OR REPLACE INTO images VALUES (?, ?, ?, ?, ?, ?)",
+                       (url, digest, os.path.getsize(save_path), headers.get("ETag"), headers.get("Last-Modified"),
+                        time.time()))
+            self._evict(db)
+
+    # drops least recently used entries until their covers fit in max_bytes, a blob goes
+    # with its last entry unless a day folder still links to it. it runs in the transaction
+    # of store(), so processes saving at the same time evict one after another
+    def _evict(self, db):
+        sizes = dict(db.execute("SELECT sha256, MAX(size) FROM images GROUP BY sha256"))
+        total = sum(sizes.values())
+        if total <= self.max_bytes: return
+        for url, digest in db.execute("SELECT url, sha256 FROM images ORDER BY used").fetchall():
+            if total <= self.max_bytes: break
+            db.execute("DELETE FROM images WHERE url = ?", (url,))
+            if db.execute("SELECT 1 FROM images WHERE sha256 = ?", (digest,)).fetchone(): continue
+            total -= sizes[digest]
+            self.blobs.release(digest)
+
+class ListingCache:
+    # parsed listing entries shared by runs and processes, one SQLite row per source.
+    # a row is fresh for ttl seconds; whoever loads a stale listing first holds a short
+    # lease on its row, the other runs wait for that result instead of hitting the site too
+    def __init__(self, db_path, ttl=600, lease=120):
+        self.db_path = db_path
+        self.ttl = ttl
+        self.lease = lease
+        with self._connect() as db:
+            db.execute("""CREATE TABLE IF NOT EXISTS listings (
+                source TEXT PRIMARY KEY, config TEXT, entries TEXT,
+                fetched REAL DEFAULT 0, lease_until REAL DEFAULT 0)""")
+
+    def _connect(self):
+        # one short-lived connection per call, so worker threads never share one
+        db = sqlite3.connect(self.db_path, timeout=30)
+        db.execute("PRAGMA journal_mode=WAL")
+        return contextlib.closing(db)
+
+    # the row only counts for the same URL and selectors
+    @staticmethod
+    def _config(source):
+        return json.dumps([source.listing_url, source.entry_selector, source.selectors], sort_keys=True)
+
+    # fresh entries of source, or None
+    def get(self, source):
+        if self.ttl <= 0: return None
+        with self._connect() as db:
+            row = db.execute("SELECT config, entries, fetched FROM listings WHERE source = ?",
+                             (source.name,)).fetchone()
+        if not row or row[0] != self._config(source) or row[2] < time.time() - self.ttl: return None
+        return json.loads(row[1])
+
+    # True when this process may load the listing, False while another one is at it
+    def acquire(self, source):
+        if self.ttl <= 0: return True
+        now = time.time()
+        with self._connect() as db, db:
+            db.execute("INSERT OR IGNORE INTO listings (source) VALUES (?)", (source.name,))
+            taken = db.execute("UPDATE listings SET lease_until = ? WHERE source = ? AND lease_until < ?",
+                               (now + self.lease, source.name, now)).rowcount
+        return taken == 1
+
+    def release(self, source):
+        if self.ttl <= 0: return
+        with self._connect() as db, db:
+            db.execute("UPDATE listings SET lease_until = 0 WHERE source = ?", (source.name,))
+
+    # the next reader loads the listing again
+    def invalidate(self, source):
+        if self.ttl <= 0: return
+        with self._connect() as db, db:
+            db.execute("UPDATE listings SET fetched = 0 WHERE source = ?", (source.name,))
+
+    def put(self, source, entries):
+        if self.ttl <= 0: return
+        with self._connect() as db, db:
+            db.execute("""INSERT OR REPLACE INTO listings (source, config, entries, fetched, lease_until)
+                          VALUES (?, ?, ?, ?, 0)""",
+                       (source.name, self._config(source), json.dumps(entries, ensure_ascii=False), time.time()))
+
+    # cached entries, or load() under the lease: returns (entries, came from the cache)
+    def fetch(self, source, load, poll=0.5):
+        while True:
+            entries = self.get(source)
+            if entries is not None: return entries, True
+            if self.acquire(source): break
+            time.sleep(poll)
+        try:
+            entries = load()
+        except Exception:
+            self.release(source)
+            raise
+        # an empty listing is a failed load, the next run tries again
+        if entries: self.put(source, entries)
+        else: self.release(source)
+        return entries, False
+
+class CircuitBreaker:
+    # health of one source during a run. closed: calls go through; open: the source is
+    # skipped; half_open: after the cooldown a single call tries again and its outcome
+    # closes or re-opens the circuit. timeouts shrink towards the latency seen so far for
+    # the same kind of request ("goto.listing", "get.detail", ...), a quick static GET says
+    # nothing about a full browser navigation
+    def __init__(self, threshold=BREAKER_THRESHOLD, cooldown=BREAKER_COOLDOWN, floor=TIMEOUT_FLOOR, factor=4.0):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.floor = floor
+        self.factor = factor
+        self.state = "closed"
+        self.failures = 0
+        self.latency = {}
+        self._opened = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "closed": return True
+            if self.state == "open" and time.monotonic() - self._opened >= self.cooldown:
+                self.state = "half_open"
+                return True
+            return False
+
+    # the source answers again, the latencies seen so far stay as they are
+    def close(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def success(self, kind, seconds):
+        self.close()
+        with self._lock:
+            # moving average, a single slow page does not stretch every timeout
+            last = self.latency.get(kind)
+            self.latency[kind] = seconds if last is None else 0.7 * last + 0.3 * seconds
+
+    def failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.threshold:
+                self.state = "open"
+                self._opened = time.monotonic()
+
+    # opens the circuit right away, for a source that is down at startup
+    def trip(self):
+        with self._lock:
+            self.failures = max(self.failures, self.threshold)
+            self.state = "open"
+            self._opened = time.monotonic()
+
+    # seconds to wait for the next call of this kind, never more than the default
+    def timeout(self, kind, default, floor=None):
+        latency = self.latency.get(kind)
+        if latency is None: return default
+        return min(default, max(floor or self.floor, latency * self.factor))
+
+    def summary(self):
+        return {"state": self.state, "failures": self.failures,
+                "latency_s": {kind: round(seconds, 3) for kind, seconds in self.latency.items()}}
+
+class RunStats:
+    # timings and counters of one run: spans time a stage ("index.zougla", "download", ...),
+    # counters count events ("page_loads.frontpages", "bytes_downloaded", ...)
     def __init__(self):
+        self.started = datetime.now()
+        self.spans = {}
+        self.counters = {}
+        self._lock = threading.Lock()
+
+    @contextlib.contextmanager
+    def span(self, name):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - started)
+
+    def add_time(self, name, seconds):
+        with self._lock:
+            self.spans.setdefault(name, []).append(seconds)
+
+    def count(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    # adds the spans and counters of another RunStats (a worker process)
+    def merge(self, spans, counters):
+        with self._lock:
+            for name, times in spans.items():
+                self.spans.setdefault(name, []).extend(times)
+            for name, amount in counters.items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+
+    def report(self, **extra):
+        spans = {name: {"count": len(times), "total_s": round(sum(times), 3), "max_s": round(max(times), 3)}
+                 for name, times in sorted(self.spans.items())}
+        return {"started": self.started.isoformat(timespec='seconds'), **extra,
+                "spans": spans, "counters": dict(sorted(self.counters.items()))}
+
+# hardlinks when the filesystem allows it, copies otherwise
+def _link_or_copy(src, dst):
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+# sha256 of a file, read in 1 MB blocks
+def file_digest(path):
+    hasher = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+class BlobStore:
+    # the one content-addressed store of cover bytes: <blob_dir>/ab/abcdef... (two levels, so
+    # no folder grows past a few thousand entries). day folders hold hardlinks to the blobs,
+    # so a cover repeated across days or titles keeps its bytes once. ImageCache keeps its
+    # validators on top of it; a blob lives while a day folder links it or the cache wants it
+    def __init__(self, blob_dir):
+        self.blob_dir = blob_dir
+
+    def path(self, digest):
+        return os.path.join(self.blob_dir, digest[:2], digest)
+
+    def put(self, path, digest):
+        blob = self.path(digest)
+        if not os.path.exists(blob):
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            try:
+                os.link(path, blob)
+                return
+            except FileExistsError:
+                # another download of the same bytes got there first
+                pass
+            except OSError:
+                # no hardlinks on this filesystem: a copy, swapped in whole
+                tmp_path = f"{blob}.{os.getpid()}.{threading.get_ident()}.tmp"
+                shutil.copyfile(path, tmp_path)
+                os.replace(tmp_path, blob)
+                return
+        if os.path.samefile(blob, path): return
+        # the same bytes are stored already: the file becomes one more link to them
+        tmp_path = path + ".link"
+        try:
+            os.link(blob, tmp_path)
+            os.replace(tmp_path, path)
+        except OSError:
+            # no hardlinks on this filesystem, the copy stays
+            if os.path.exists(tmp_path): os.remove(tmp_path)
+
+    # moves a file that already holds digest's bytes into the store
+    def adopt(self, path, digest):
+        blob = self.path(digest)
+        os.makedirs(os.path.dirname(blob), exist_ok=True)
+        if os.path.exists(blob): os.remove(path)
+        else: os.replace(path, blob)
+
+    # removes the blob when no day folder links to it, returns its size or 0
+    def release(self, digest):
+        blob = self.path(digest)
+        try:
+            info = os.stat(blob)
+            if info.st_nlink > 1: return 0
+            os.remove(blob)
+            return info.st_size
+        except OSError:
+            return 0
+
+    # drops the blobs no day folder links to anymore, except those in keep.
+    # returns (count, bytes)
+    def prune(self, keep=()):
+        removed, freed = 0, 0
+        if not os.path.isdir(self.blob_dir): return removed, freed
+        for fan in os.listdir(self.blob_dir):
+            for digest in os.listdir(os.path.join(self.blob_dir, fan)):
+                if digest in keep: continue
+                size = self.release(digest)
+                if size:
+                    removed += 1
+                    freed += size
+        return removed, freed
+
+class DayArchive:
+    # days past their useful life, packed per month into <archive_dir>/YYYY-MM.zip:
+    # blobs/<sha256> holds every distinct file once, days/<date>.json maps the day's
+    # relative paths to those blobs. the zip central directory is the random-access index,
+    # index.json says which month file has which day
+    def __init__(self, archive_dir):
+        self.archive_dir = archive_dir
+        self.index_path = os.path.join(archive_dir, "index.json")
+        try:
+            with open(self.index_path, encoding='utf-8') as f:
+                self.index = json.load(f)
+        except Exception:
+            self.index = {}
+
+    # packs the given day folders, only removes them once their month file is in place
+    def pack(self, day_dirs):
+        import zipfile
+        os.makedirs(self.archive_dir, exist_ok=True)
+        months = {}
+        for day_dir in sorted(day_dirs):
+            months.setdefault(os.path.basename(day_dir)[:7], []).append(day_dir)
+        packed, stored = [], 0
+        for month, folders in months.items():
+            zip_path = os.path.join(self.archive_dir, f"{month}.zip")
+            # appending in place would leave a broken central directory after a crash,
+            # the month file is rebuilt next to the old one and swapped in
+            tmp_path = zip_path + ".tmp"
+            if os.path.exists(zip_path): shutil.copyfile(zip_path, tmp_path)
+            with zipfile.ZipFile(tmp_path, 'a') as archive:
+                names = set(archive.namelist())
+                for folder in folders:
+                    files = {}
+                    for parent, _, filenames in os.walk(folder):
+                        for filename in filenames:
+                            path = os.path.join(parent, filename)
+                            digest = file_digest(path)
+                            if f"blobs/{digest}" not in names:
+                                # images and PDFs are compressed already
+                                compress = (zipfile.ZIP_STORED if filename.lower().endswith(ARCHIVE_STORED)
+                                            else zipfile.ZIP_DEFLATED)
+                                archive.write(path, f"blobs/{digest}", compress_type=compress)
+                                names.add(f"blobs/{digest}")
+                                stored += 1
+                            files[os.path.relpath(path, folder).replace(os.sep, "/")] = digest
+                    day_entry = f"days/{os.path.basename(folder)}.json"
+                    if day_entry in names:
+                        # a restored day goes away again only if nothing in it changed
+                        if json.loads(archive.read(day_entry)) != files:
+                            print(f"    ⚠️ {os.path.basename(folder)} changed since it was restored, left in place.")
+                            continue
+                    else:
+                        archive.writestr(day_entry, json.dumps(files, ensure_ascii=False))
+                    packed.append(folder)
+            os.replace(tmp_path, zip_path)
+            for folder in folders:
+                if folder in packed: self.index[os.path.basename(folder)] = os.path.basename(zip_path)
+            self._save()
+        for folder in packed:
+            shutil.rmtree(folder)
+        return packed, stored
+
+    # unpacks one day into dest_dir, False when the archive does not have it
+    def restore(self, day, dest_dir):
+        import zipfile
+        if day not in self.index: return False
+        with zipfile.ZipFile(os.path.join(self.archive_dir, self.index[day])) as archive:
+            files = json.loads(archive.read(f"days/{day}.json"))
+            for relative_path, digest in files.items():
+                target = os.path.join(dest_dir, *relative_path.split("/"))
+                os.makedirs(os.path.dirname(target), exist_ok=True)
+                with archive.open(f"blobs/{digest}") as source, open(target, 'wb') as f:
+                    shutil.copyfileobj(source, f, 1024 * 1024)
+        return True
+
+    def _save(self):
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(dict(sorted(self.index.items())), f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+class NewspaperBot:
+    def __init__(self, engine="playwright", download_workers=8, per_host_downloads=4, async_pages=4,
+                 cache_mb=512, incremental_pdf=True, match_threshold=0.7, lean=False,
+                 listing_ttl=600, derivatives=False, drop_stale=False, workers=1,
+                 application_path=None, pause=True):
         # determines if the script is running as a bundled .exe or as a script
-        if getattr(sys, 'frozen', False):
+        if application_path:
+            # an explicit folder (benchmarks, tools) takes the place of the script folder
+            self.application_path = application_path
+        elif getattr(sys, 'frozen', False):
             # if its frozen, get the folder of the .exe(frozen? = am i running as exe)
             self.application_path = os.path.dirname(sys.executable)
         else:
@@ -39,10 +825,103 @@ class NewspaperBot:
         self.root_dir = os.path.join(self.application_path, "downloaded_news_pictures")
         self.today_dir = self._setup_directory()
         self.downloaded_images = []
+
+        # console pauses so errors stay readable when the .exe window closes
+        self.pause = pause
+
+        # stage timings and counters, reported next to the daily PDF after every run
+        self.stats = RunStats()
+        self.report_path = os.path.join(self.today_dir, "run_reports.jsonl")
+
+        # per-day record of every title, lets a later run skip what is already done
+        self.manifest_path = os.path.join(self.today_dir, "manifest.json")
+        self.manifest = self._load_manifest()
+        # reruns add late covers to the existing daily PDF instead of rebuilding it
+        self.incremental_pdf = incremental_pdf
+        # thumbnails and WebP/AVIF copies for the dashboard, made after the PDF
+        self.derivatives = derivatives
         
-        # conserve urls as an object attribute
-        self.url_frontpages = "https://www.frontpages.gr/"
-        self.url_zougla = "https://www.zougla.gr/newspapers/"
+        # sites to search, in priority order (sources.json beside the CSV can add more)
+        self.sources_by_name = {source.name: source
+                                for source in load_sources(os.path.join(self.application_path, "sources.json"))}
+        self.sources = [source for source in self.sources_by_name.values() if source.enabled]
+
+        # each listing page is loaded once per run: source -> {normalized name: (date text, url)}
+        self.listing_index = {}
+        self._index_locks = {}
+        # a source that is down or keeps failing is skipped instead of timing out for every title
+        self.breakers = {source.name: CircuitBreaker() for source in self.sources}
+        # parsed listings are shared with runs and processes started within listing_ttl seconds
+        self.listing_cache = ListingCache(os.path.join(self.application_path, "listing_cache.sqlite"),
+                                          ttl=listing_ttl)
+        # names that differ from the CSV ("Νέα Εγνατία" / "ΝΕΑ ΕΓΝΑΤΙΑ - Θεσ/νίκη") are matched
+        # fuzzily, all CSV names of a run at once: source -> {normalized csv name: listing name}
+        self.match_threshold = match_threshold
+        self.targets = []
+        self.fuzzy_matches = {}
+
+        # "http" parses static pages and only starts a browser when that finds nothing
+        self.engine = engine
+        self.session = None
+        self._playwright = None
+        self.browser = None
+        self.page = None
+        # number of browser pages the async engine works with at once
+        self.async_pages = async_pages
+        # block images/fonts/third-party hosts and stop waiting at DOMContentLoaded
+        self.lean = lean
+        self._nav_stats = {}
+
+        # a browser kept warm by --serve-browser, and the channel that launched last time
+        self.daemon_path = os.path.join(self.application_path, "browser_daemon.json")
+        # --watch keeps one browser for all polls instead of one per run
+        self.watching = False
+        self._listing_hashes = {}
+        self.channel_path = os.path.join(self.application_path, "browser_channel.json")
+
+        # --workers splits the titles over processes with a browser each
+        self.workers = workers
+
+        # covers are downloaded together after lookups, a few at a time per host
+        self.download_workers = download_workers
+        self.per_host_downloads = per_host_downloads
+        self._host_slots = {}
+        self._host_lock = threading.Lock()
+
+        # cover bytes are kept once under their sha256, day folders link to them and
+        # compaction packs old days into archive/YYYY-MM.zip
+        self.blobs = BlobStore(os.path.join(self.root_dir, ".blobs"))
+        self.archive = DayArchive(os.path.join(self.root_dir, "archive"))
+
+        # covers fetched by earlier runs are revalidated instead of downloaded again
+        self.image_cache = ImageCache(os.path.join(self.root_dir, ".cache"), self.blobs,
+                                      max_bytes=cache_mb * 1024 * 1024)
+
+        # new covers that match an earlier day of the same title are flagged in the manifest,
+        # drop_stale also leaves them out of the PDF
+        self.drop_stale = drop_stale
+        self.hashes_path = os.path.join(self.root_dir, ".cache", "cover_hashes.npz")
+        self.cover_hashes = None
+
+    # conserve urls as an object attribute, the built-in sources keep their old names
+    @property
+    def url_frontpages(self):
+        return self.sources_by_name["frontpages"].listing_url
+
+    @url_frontpages.setter
+    def url_frontpages(self, url):
+        self.sources_by_name["frontpages"].listing_url = url
+
+    @property
+    def url_zougla(self):
+        return self.sources_by_name["zougla"].listing_url
+
+    @url_zougla.setter
+    def url_zougla(self, url):
+        self.sources_by_name["zougla"].listing_url = url
+
+    def _pause(self, seconds):
+        if self.pause: time.sleep(seconds)
 
     # it searches if todays date folder exist or else it creates it
     def _setup_directory(self):
@@ -83,14 +962,7 @@ class NewspaperBot:
     def _normalize_text(self, text):
         try:
             if not text: return ""
-            text = text.lower().strip()
-            # remove non essential characters
-            text = ''.join(c for c in unicodedata.normalize('NFD', text) 
-                        if unicodedata.category(c) != 'Mn')
-            # cleanse to only alphanumeric and spaces (including Greek letters)
-            text = re.sub(r'[^a-z0-9\sα-ω]', '', text)
-            # return cleaned text
-            return text.strip()
+            return normalize_name(text)
         except Exception as e:
             # crash prevention
             print(f"⚠️ Warning: Could not normalize text '{text}'. Error: {e}")
@@ -132,194 +1004,1353 @@ class NewspaperBot:
         except Exception:
             return True 
 
-    def _download_file(self, page, url, filename):
+    def _download_file(self, url, filename):
+        import requests, urllib3
         try:
             print(f"    ⬇️  Downloading: {filename}...")
-            # Use requests for direct file download, as it's cleaner for binary files
-            # and avoids Playwright's page context.
-            response = requests.get(url, timeout=60, stream=True)
-            response.raise_for_status() # Raise exception for bad status codes
-            
             clean_name = re.sub(r'[^\w\-_\.]', '', filename)
             save_path = os.path.join(self.today_dir, clean_name)
-            
-            with open(save_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)# if file is large, write in chunks
-                    
+            part_path = save_path + ".part"
+
+            # Use requests for direct file download, as it's cleaner for binary files
+            # and avoids Playwright's page context.
+            session = self._get_session()
+            response = None
+            # a transfer an earlier run left half done goes straight to a Range request
+            if not self._partial_size(url, part_path):
+                response = session.get(url, timeout=60, stream=True, headers=self.image_cache.validators(url))
+                if response.status_code == 304:
+                    response.close()
+                    digest = self.image_cache.restore(url, save_path)
+                    if digest:
+                        self.stats.count("cache_hits")
+                        print(f"    ♻️  Not modified, reused cached copy: {clean_name}")
+                        return save_path, digest
+                    # cache entry vanished in between, fetch the whole file
+                    response = None
+
+            digest, headers = self._stream(session, url, part_path, response)
+            # the old file may be a hardlink into the cache, replacing the name leaves it intact
+            os.replace(part_path, save_path)
+            self.image_cache.store(url, save_path, digest, headers)
             print(f"    ✅ Saved: {clean_name}")
-            return save_path
-        except requests.exceptions.RequestException as e:
+            return save_path, digest
+        except (requests.exceptions.RequestException, urllib3.exceptions.HTTPError) as e:
             print(f"    ❌ Download failed (Requests Error): {e}")
         except Exception as e:
             print(f"    ❌ Download failed (General Error): {e}")
+        self.stats.count("downloads_failed")
         return None
 
+    # streams url into part_path, returns (sha256, response headers). a dropped connection
+    # continues with a Range request from the bytes already on disk
+    def _stream(self, session, url, part_path, response=None):
+        import requests, urllib3
+        for attempt in range(DOWNLOAD_RESUMES + 1):
+            try:
+                if response is None:
+                    response = self._resume_request(session, url, part_path)
+                response.raise_for_status() # Raise exception for bad status codes
+                with response:
+                    return self._write_part(url, part_path, response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout,
+                    requests.exceptions.ChunkedEncodingError, urllib3.exceptions.HTTPError) as e:
+                if attempt == DOWNLOAD_RESUMES: raise
+                self.stats.count("download_resumes")
+                print(f"    🔁 Transfer of {os.path.basename(part_path[:-5])} interrupted, resuming: {e}")
+                response = None
+
+    # bytes of part_path that belong to url, 0 when there is nothing to resume
+    def _partial_size(self, url, part_path):
+        try:
+            with open(part_path + ".json", encoding='utf-8') as f:
+                if json.load(f).get("url") != url: return 0
+            return os.path.getsize(part_path)
+        except (OSError, ValueError):
+            return 0
+
+    def _resume_request(self, session, url, part_path):
+        size = self._partial_size(url, part_path)
+        if size:
+            with open(part_path + ".json", encoding='utf-8') as f:
+                meta = json.load(f)
+            headers = {"Range": f"bytes={size}-"}
+            # the server sends the whole file instead when it changed in the meantime
+            validator = meta.get("etag") or meta.get("last_modified")
+            if validator: headers["If-Range"] = validator
+            response = session.get(url, timeout=60, stream=True, headers=headers)
+            content_range = response.headers.get("Content-Range", "")
+            if response.status_code == 206 and content_range.startswith(f"bytes {size}-"):
+                return response
+            # a 200 rewrites the .part by itself, other errors go to raise_for_status
+            if response.status_code not in (206, 416):
+                return response
+            # 416 (the .part already holds the whole file, or more) or a range we did not
+            # ask for: the leftover goes, otherwise every later run asks for the same range
+            response.close()
+            self._drop_part(part_path)
+        return session.get(url, timeout=60, stream=True)
+
+    def _write_part(self, url, part_path, response):
+        hasher = hashlib.sha256()
+        head = b""
+        offset = 0
+        if response.status_code == 206:
+            # the bytes already on disk go into the hash first
+            with open(part_path, 'rb') as f:
+                for block in iter(lambda: f.read(DOWNLOAD_CHUNK_MAX), b""):
+                    if not head: head = block[:2]
+                    hasher.update(block)
+                    offset += len(block)
+        else:
+            with open(part_path + ".json", 'w', encoding='utf-8') as f:
+                json.dump({"url": url, "etag": response.headers.get("ETag"),
+                           "last_modified": response.headers.get("Last-Modified")}, f)
+        length = response.headers.get("Content-Length")
+        if length and offset + int(length) > MAX_COVER_BYTES:
+            self._drop_part(part_path)
+            raise ValueError(f"cover is larger than {MAX_COVER_BYTES // (1024 * 1024)} MB")
+
+        # chunks grow while reads come back quickly and shrink when the connection stalls
+        chunk_size, tail = DOWNLOAD_CHUNK_MIN, b""
+        with open(part_path, 'ab' if offset else 'wb') as f:
+            while True:
+                started = time.perf_counter()
+                chunk = response.raw.read(chunk_size, decode_content=True)
+                if not chunk: break
+                elapsed = time.perf_counter() - started
+                offset += len(chunk)
+                if offset > MAX_COVER_BYTES:
+                    f.close()
+                    self._drop_part(part_path)
+                    raise ValueError(f"cover is larger than {MAX_COVER_BYTES // (1024 * 1024)} MB")
+                f.write(chunk)
+                hasher.update(chunk)
+                self.stats.count("bytes_downloaded", len(chunk))
+                if not head: head = chunk[:2]
+                tail = (tail + chunk)[-64:]
+                if elapsed < 0.05 and len(chunk) == chunk_size: chunk_size = min(chunk_size * 2, DOWNLOAD_CHUNK_MAX)
+                elif elapsed > 0.5: chunk_size = max(chunk_size // 2, DOWNLOAD_CHUNK_MIN)
+
+        # a JPEG that stops before its end-of-image marker was cut off, no need to decode it
+        if head == b"\xff\xd8" and not tail.rstrip(b"\x00\r\n").endswith(b"\xff\xd9"):
+            self._drop_part(part_path)
+            raise ValueError("truncated JPEG (no end-of-image marker)")
+        os.remove(part_path + ".json")
+        return hasher.hexdigest(), response.headers
+
+    def _drop_part(self, part_path):
+        for path in (part_path, part_path + ".json"):
+            if os.path.exists(path): os.remove(path)
+
+    # downloads (url, filename) jobs on a thread pool, results keep the order of the jobs
+    # and are (path, sha256) or None
+    def _download_all(self, jobs):
+        if not jobs: return []
+        with self.stats.span("download"), ThreadPoolExecutor(max_workers=self.download_workers) as pool:
+            return list(pool.map(lambda job: self._download_limited(*job), jobs))
+
+    def _download_limited(self, url, filename):
+        # cap parallel transfers per host so one site is not hammered
+        host = urlparse(url).netloc
+        with self._host_lock:
+            slots = self._host_slots.setdefault(host, threading.BoundedSemaphore(self.per_host_downloads))
+        with slots, self.stats.span(f"download.{host}"):
+            return self._download_file(url, filename)
+
     def _handle_popups(self, page, site_name):
         # Placeholder for potential cookie/popup handling on Zougla.gr
         pass 
 
-    # --- Site Logic ---
-    def _search_frontpages(self, page, target_name):
-        print(f"    🔎 Checking Frontpages.gr for {target_name}...")
+    # --- Browser / HTTP ---
+    # tries system-installed browsers first (Chrome, then Edge), then the bundled Chromium
+    def _launch_browser(self, p, args=None):
+        # a warm browser from --serve-browser skips the whole launch sequence
+        if args is None:
+            browser = self._connect_daemon(p)
+            if browser: return browser
+
+        # NOTE: If you bundled the browser using PLAYWRIGHT_BROWSERS_PATH=0, 
+        # Playwright will automatically find the bundled browser here.
+        for channel in self._launch_order():
+            try:
+                browser = p.chromium.launch(headless=True, channel=channel, args=args or [])
+                self._remember_channel(channel)
+                return browser
+            except Exception:
+                print(f"⚠️ {CHANNEL_LABELS[channel]} not found, trying the next browser...")
+        print("🛑 ERROR: Failed to launch any Chromium browser.")
+        print("👉 Please ensure Chrome/Edge is installed or that you bundled a Playwright browser.")
+        return None
+
+    # Chrome, then Edge, then bundled Chromium, but the channel that worked last time goes first
+    def _launch_order(self):
         try:
-            page.goto(self.url_frontpages, timeout=60000)
-            thumbers = page.locator(".thumber").all()
-            found_small_img_src = None
-            
-            for thumber in thumbers:
-                name_el = thumber.locator(".paperName a")
-                if not name_el.count(): continue
-                
-                # Compare normalized names
-                if self._normalize_text(name_el.text_content()) == target_name:
-                    date_el = thumber.locator(".paperdate")
-                    # Check the date and skip if it's old
-                    if not self._check_date_generic(date_el.text_content() if date_el.count() else ""):
-                        return None 
-                        
-                    img_el = thumber.locator("img").first
-                    if img_el.count():
-                        found_small_img_src = img_el.get_attribute("src")
-                        break
-            
-            if found_small_img_src and found_small_img_src.endswith('300.jpg'):
-                # Convert small image URL to high-res image URL
-                image_path = found_small_img_src.replace('300.jpg', 'I.jpg')
-                full_img_url = urljoin(self.url_frontpages, image_path)
-                
-                # NOTE: Switched to requests download for stability
-                return self._download_file(page, full_img_url, f"{target_name}_fp.jpg")
+            with open(self.channel_path, encoding='utf-8') as f:
+                last = json.load(f)["channel"]
+        except Exception:
+            return BROWSER_CHANNELS
+        if last not in BROWSER_CHANNELS: return BROWSER_CHANNELS
+        return (last,) + tuple(channel for channel in BROWSER_CHANNELS if channel != last)
+
+    def _remember_channel(self, channel):
+        try:
+            with open(self.channel_path, 'w', encoding='utf-8') as f:
+                json.dump({"channel": channel}, f)
+        except OSError as e:
+            print(f"⚠️ Could not remember the browser channel: {e}")
+
+    def _daemon_endpoint(self):
+        try:
+            with open(self.daemon_path, encoding='utf-8') as f:
+                return f"http://127.0.0.1:{json.load(f)['port']}"
+        except Exception:
             return None
-        except Exception as e:
-            print(f"    ⚠️ Frontpages.gr search failed: {e}")
+
+    def _connect_daemon(self, p):
+        endpoint = self._daemon_endpoint()
+        if not endpoint: return None
+        try:
+            browser = p.chromium.connect_over_cdp(endpoint, timeout=3000)
+            print(f"🔌 Connected to the running browser at {endpoint}")
+            return browser
+        except Exception:
+            print("⚠️ Browser daemon not reachable, launching a new browser...")
             return None
 
-    def _search_zougla(self, page, target_name):
-        print(f"    🔎 Checking Zougla.gr for {target_name}...")
-        try:
-            page.goto(self.url_zougla, timeout=60000)
-            self._handle_popups(page, "Zougla.gr") 
-            blocks = page.locator(".newspaper-block").all()
-            found_link_href = None
-
-            for block in blocks:
-                info = block.locator(".newspaper-info")
-                if not info.locator("strong").count(): continue
-                
-                # Compare normalized names
-                if self._normalize_text(info.locator("strong").text_content()) == target_name:
-                    date_match = re.search(r'(\d{2}/\d{2}/\d{4})', info.text_content())
-                    if date_match and not self._check_date_generic(date_match.group(1)): return None
-                    
-                    link_el = block.locator(".front-img a").first
-                    if link_el.count():
-                        found_link_href = link_el.get_attribute("href")
-                        break
-            
-            if not found_link_href: return None
-            
-            # Go to the detail page
-            page.goto(urljoin(self.url_zougla, found_link_href), timeout=60000)
-            
-            # Find High Res image source
-            img_src = None
-            if page.locator(".newspaper-cover img").count():
-                img_src = page.locator(".newspaper-cover img").first.get_attribute("src")
-            
-            if img_src:
-                # NOTE: Switched to requests download for stability
-                full_img_url = urljoin(self.url_zougla, img_src)
-                return self._download_file(page, full_img_url, f"{target_name}_zg.jpg")
+    # keeps one browser running for later runs to connect to, until Ctrl+C
+    def serve_browser(self, port=9222):
+        from playwright.sync_api import sync_playwright
+        with sync_playwright() as p:
+            print("🚀 Launching browser daemon...")
+            browser = self._launch_browser(p, args=[f"--remote-debugging-port={port}"])
+            if browser is None: return
+            with open(self.daemon_path, 'w', encoding='utf-8') as f:
+                json.dump({"port": port, "pid": os.getpid()}, f)
+            print(f"🌐 Browser ready on port {port}, runs will reuse it. Press Ctrl+C to stop.")
+            try:
+                while browser.is_connected():
+                    time.sleep(1)
+            except KeyboardInterrupt:
+                pass
+            finally:
+                if os.path.exists(self.daemon_path): os.remove(self.daemon_path)
+                browser.close()
+        print("\n✨ Browser daemon stopped.")
+
+    # the browser is started on first use, so the http engine may never launch it
+    def _get_page(self):
+        if self.page is None:
+            if self._playwright is None:
+                from playwright.sync_api import sync_playwright
+                print("🚀 Launching browser...")
+                with self.stats.span("browser_launch"):
+                    self._playwright = sync_playwright().start()
+                    self.browser = self._launch_browser(self._playwright)
+            if self.browser is None:
+                raise RuntimeError("no Chromium browser available")
+            # Use a new context to avoid sharing cookies/cache between runs
+            self.page = self.browser.new_context().new_page()
+            if self.lean: self._make_lean(self.page)
+        return self.page
+
+    # --- Lean navigation ---
+    def _make_lean(self, page):
+        stats = self._lean_stats(page)
+        def handle(route):
+            if self._should_block(route.request):
+                stats["blocked"] += 1
+                route.abort()
+            else:
+                route.continue_()
+        page.route("**/*", handle)
+
+    def _lean_stats(self, page):
+        stats = self._nav_stats[id(page)] = {"blocked": 0, "bytes": 0}
+        page.on("response", lambda response: self._count_bytes(stats, response))
+        return stats
+
+    def _should_block(self, request):
+        if request.resource_type in LEAN_BLOCKED_RESOURCES: return True
+        host = urlparse(request.url).hostname or ""
+        # anything that is not one of the sources is ads/analytics
+        sites = {urlparse(source.listing_url).hostname.removeprefix("www.") for source in self.sources}
+        return not any(host == site or host.endswith("." + site) for site in sites)
+
+    def _count_bytes(self, stats, response):
+        try:
+            stats["bytes"] += int(response.headers.get("content-length", 0))
+        except ValueError:
+            pass
+
+    def _reset_nav_stats(self, page):
+        stats = self._nav_stats.get(id(page))
+        if stats: stats.update(blocked=0, bytes=0)
+        return time.perf_counter()
+
+    def _report_navigation(self, page, source, started):
+        stats = self._nav_stats.get(id(page))
+        if not stats: return
+        print(f"    🪶 {source.label}: {time.perf_counter() - started:.1f}s, {stats['bytes'] / 1024:.0f} KB loaded, "
+              f"{stats['blocked']} requests blocked")
+
+    def _goto(self, page, url, source, selector):
+        self.stats.count(f"page_loads.{source.name}")
+        kind = "goto.listing" if selector == source.entry_selector else "goto.detail"
+        with self.stats.span(f"navigate.{source.name}"), self._guarded(source, kind) as timeout:
+            if not self.lean:
+                page.goto(url, timeout=timeout(60000, FULL_NAVIGATION_FLOOR))
+                return
+            started = self._reset_nav_stats(page)
+            page.goto(url, wait_until="domcontentloaded", timeout=timeout(source.timeout))
+            # the entries may still be rendered by scripts after DOMContentLoaded
+            page.wait_for_selector(selector, state="attached", timeout=timeout(source.timeout))
+            self._report_navigation(page, source, started)
+
+    # the playwright engine needs the browser up front, fail early like before
+    def _browser_ready(self):
+        if self.engine != "playwright": return True
+        try:
+            self._get_page()
+            return True
+        except Exception:
+            return False
+
+    def _close_browser(self):
+        try:
+            if self.browser: self.browser.close()
+            if self._playwright: self._playwright.stop()
+        except Exception as e:
+            print(f"⚠️ Could not close browser cleanly: {e}")
+        self.browser = self.page = self._playwright = None
+
+    # one pooled keep-alive session for listing pages, detail pages and images
+    def _get_session(self):
+        import requests
+        from urllib3.util.retry import Retry
+        if self.session is None:
+            self.session = requests.Session()
+            # retry with backoff on connection errors and busy/failing servers
+            retries = Retry(total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504))
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=max(16, self.download_workers),
+                                                    max_retries=retries)
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+            self.session.headers["User-Agent"] = USER_AGENT
+        return self.session
+
+    def _fetch_html(self, url, source):
+        self.stats.count(f"page_loads.{source.name}")
+        kind = "get.listing" if url == source.listing_url else "get.detail"
+        with self.stats.span(f"navigate.{source.name}"), self._guarded(source, kind) as timeout:
+            response = self._get_session().get(url, timeout=timeout(30000) / 1000)
+            response.raise_for_status()
+        # hand bytes to the parser so it picks the charset from the page itself
+        return response.content
+
+    # --- Source Health ---
+    # wraps one request to a source and reports its outcome to the source's breaker. yields
+    # a function turning the default timeout (ms) into one adapted to the latency seen so
+    # far for this kind of request, floor (s) raises the breaker's own
+    @contextlib.contextmanager
+    def _guarded(self, source, kind):
+        breaker = self.breakers[source.name]
+        started = time.perf_counter()
+        try:
+            yield lambda default_ms, floor=None: int(breaker.timeout(kind, default_ms / 1000, floor) * 1000)
+        except Exception:
+            breaker.failure()
+            if breaker.state == "open":
+                self.stats.count(f"breaker_opened.{source.name}")
+            raise
+        breaker.success(kind, time.perf_counter() - started)
+
+    def _source_allowed(self, source):
+        if self.breakers[source.name].allow(): return True
+        self.stats.count(f"breaker_skips.{source.name}")
+        return False
+
+    # one cheap request per source before the lookups, all at once: a site that does not
+    # answer within PROBE_TIMEOUT is skipped this run (until a half-open retry succeeds).
+    # only up or down, the headers arriving fast says nothing about the page timeouts
+    def _probe_sources(self):
+        import requests
+        def probe(source):
+            try:
+                with requests.get(source.listing_url, timeout=PROBE_TIMEOUT, stream=True,
+                                  headers={"User-Agent": USER_AGENT}) as response:
+                    # 4xx still means the site is up (some block plain HTTP clients)
+                    if response.status_code >= 500: raise RuntimeError(f"HTTP {response.status_code}")
+                self.breakers[source.name].close()
+            except Exception as e:
+                self.breakers[source.name].trip()
+                self.stats.count(f"breaker_opened.{source.name}")
+                print(f"🩺 {source.label} is not responding, skipping it for now: {e}")
+        with self.stats.span("probe"), ThreadPoolExecutor(max_workers=len(self.sources) or 1) as pool:
+            list(pool.map(probe, self.sources))
+
+    def _report_breakers(self):
+        for source in self.sources:
+            breaker = self.breakers[source.name]
+            if breaker.state != "closed" or breaker.failures:
+                print(f"🩺 {source.label}: circuit {breaker.state.replace('_', '-')}, "
+                      f"{breaker.failures} failures in a row")
+
+    # --- Listing Index ---
+    # loads a listing page once and keeps every entry, so each CSV name is a dict lookup.
+    # allow_browser=False is for worker threads, the sync browser belongs to the main thread.
+    # a failed load is not kept: the next lookup tries again unless the breaker is open
+    def _get_index(self, source, allow_browser=True):
+        with self._index_locks.setdefault(source.name, threading.Lock()):
+            if source.name not in self.listing_index:
+                if not self._source_allowed(source): return {}
+                with self.stats.span(f"index.{source.name}"):
+                    index = self._build_index(source, allow_browser)
+                if index or (allow_browser and index is not None):
+                    self.listing_index[source.name] = index
+        return self.listing_index.get(source.name, {})
+
+    def _build_index(self, source, allow_browser=True):
+        load = lambda: self._load_entries(source, allow_browser)
+        try:
+            entries, cached = self.listing_cache.fetch(source, load)
+        except sqlite3.Error as e:
+            print(f"    ⚠️ Listing cache unavailable: {e}")
+            entries, cached = load(), False
+        if entries is None: return None
+        if cached:
+            self.stats.count(f"listing_cache_hits.{source.name}")
+            print(f"    ♻️ Reusing the cached {source.label} listing")
+        index = self._index_entries(entries, source)
+        print(f"    ✅ Indexed {len(index)} entries from {source.label}")
+        return index
+
+    # listing entries, [] when the page has none and None when it could not be loaded
+    def _load_entries(self, source, allow_browser=True):
+        print(f"    📚 Indexing {source.label}...")
+        entries, failed = [], False
+        if self.engine == "http":
+            try:
+                entries = source.parse_entries(self._fetch_html(source.listing_url, source))
+            except Exception as e:
+                print(f"    ⚠️ Static parse of {source.label} failed: {e}")
+                failed = True
+            if not entries and not allow_browser:
+                return None if failed else entries
+            if not entries:
+                print(f"    ⚠️ Static parse of {source.label} found nothing, falling back to the browser...")
+        if not entries:
+            try:
+                entries = self._extract_entries(self._get_page(), source)
+                failed = False
+            except Exception as e:
+                print(f"    ⚠️ Could not index {source.label}: {e}")
+                failed = True
+        return None if failed else entries
+
+    # http engine: the listings load side by side, so a paper missing from the preferred
+    # site costs about max(sources) instead of their sum. Lower priorities start staggered
+    # by PREFETCH_STAGGER: once the listings loaded so far have every CSV name exactly, the
+    # ones still waiting are never fetched (a request already under way runs to its end)
+    def _prefetch_indexes(self):
+        pending = [source for source in self.sources if source.name not in self.listing_index]
+        if self.engine != "http" or len(pending) < 2: return
+        stop = threading.Event()
+        def fetch(source, delay):
+            if stop.wait(delay):
+                self.stats.count(f"prefetch_skipped.{source.name}")
+                return
+            self._get_index(source, False)
+        pool = ThreadPoolExecutor(max_workers=len(pending))
+        futures = {source.name: pool.submit(fetch, source, position * PREFETCH_STAGGER)
+                   for position, source in enumerate(pending)}
+        try:
+            for position, source in enumerate(self.sources):
+                if source.name in futures: futures[source.name].result()
+                done = self.sources[:position + 1]
+                if all(any(self._has_entry(s, target) for s in done) for target in self.targets):
+                    break
+        finally:
+            stop.set()
+            pool.shutdown(wait=False)
+
+    # a fuzzy match is no reason to stop, a later listing may still have the exact name
+    def _has_entry(self, source, target_name):
+        return target_name in self.listing_index.get(source.name, {})
+
+    # exact names on every source come before any fuzzy match: "Ελεύθερος Τύπος της Κυριακής"
+    # listed as such on Zougla beats the weekday edition fuzzily matched on Frontpages
+    def _search_order(self):
+        return [(source, fuzzy) for fuzzy in (False, True) for source in self.sources]
+
+    # index entry for a CSV name: the exact key, or with fuzzy=True the best fuzzy match
+    # of a name the listing does not have exactly
+    def _find_entry(self, source, target_name, fuzzy=False):
+        index = self._get_index(source)
+        # no listing (site down or skipped), nothing to match against
+        if not index: return None
+        if not fuzzy:
+            if target_name not in index: return None
+            self.stats.count(f"matches.{source.name}")
+            return index[target_name]
+        with self.stats.span("fuzzy_match"):
+            key = self._fuzzy_matches(source, target_name).get(target_name)
+        if not key:
+            self.stats.count(f"misses.{source.name}")
             return None
+        self.stats.count(f"fuzzy_matches.{source.name}")
+        print(f"    🔤 Matched '{target_name}' to '{key}' on {source.label}")
+        return index[key]
+
+    def _fuzzy_matches(self, source, target_name):
+        matches = self.fuzzy_matches.get(source.name)
+        if matches is None or target_name not in matches["targets"]:
+            index = self.listing_index[source.name]
+            targets = list(dict.fromkeys(self.targets + [target_name]))
+            # listing names that are exact hits for other CSV names are taken already
+            names = [name for name in index if name not in targets]
+            misses = [target for target in targets if target not in index]
+            # titles another listing has exactly never compete for a fuzzy match
+            listed = set().union(*self.listing_index.values())
+            try:
+                found = fuzzy_match(names, misses, self.match_threshold, skip=listed)
+            except Exception as e:
+                print(f"    ⚠️ Fuzzy matching on {source.label} failed: {e}")
+                found = {}
+            matches = self.fuzzy_matches[source.name] = {"targets": set(targets), "found": found}
+        return matches["found"]
+
+    # pulls all entries of a listing page in a single round-trip
+    def _extract_entries(self, page, source):
+        self._goto(page, source.listing_url, source, source.entry_selector)
+        self._handle_popups(page, source.label)
+        self.stats.count("locator_calls")
+        return page.eval_on_selector_all(source.entry_selector, ENTRIES_JS, source.selectors)
+
+    def _index_entries(self, entries, source):
+        index = {}
+        for entry in entries:
+            key = self._normalize_text(entry.get("name"))
+            if not key or key in index: continue # first entry wins
+            if not entry.get("url"): continue
+            index[key] = (source.parse_date(entry.get("date") or ""), entry["url"])
+        return index
+
+    # --- Site Logic ---
+    # lookups only resolve the high-res (url, filename), downloading happens afterwards in bulk
+    def _search(self, source, target_name, fuzzy=False):
+        if not fuzzy: print(f"    🔎 Checking {source.label} for {target_name}...")
+        try:
+            entry = self._find_entry(source, target_name, fuzzy)
+            if not entry: return None
+
+            link = self._entry_link(source, entry)
+            if not link: return None
+            if source.cover_selector:
+                if not self._source_allowed(source): return None
+                # Go to the detail page and find the High Res image source
+                img_src = self._cover_from_detail(source, link)
+                if not img_src: return None
+                link = urljoin(source.listing_url, img_src)
+            return (link, f"{target_name}_{source.suffix}.jpg")
         except Exception as e:
-            print(f"    ⚠️ Zougla.gr search failed: {e}")
+            print(f"    ⚠️ {source.label} search failed: {e}")
             return None
 
+    # the URL an entry leads to: the high-res cover itself, or the detail page holding it
+    def _entry_link(self, source, entry):
+        date_text, url = entry
+        # Check the date and skip if it's old
+        if not self._check_date_generic(date_text): return None
+        if not url: return None
+        return source.detail_url(url) if source.cover_selector else source.cover_url(url)
+
+    # a static GET first on every engine: the download fallback of the async engine runs
+    # after its browser is closed and should not launch another one for a single page
+    def _cover_from_detail(self, source, detail_url):
+        img_src = None
+        try:
+            img_src = source.parse_cover(self._fetch_html(detail_url, source))
+        except Exception as e:
+            print(f"    ⚠️ Static parse of the detail page failed: {e}")
+        if not img_src:
+            page = self._get_page()
+            self._goto(page, detail_url, source, source.cover_selector)
+            self.stats.count("locator_calls")
+            img_src = page.eval_on_selector_all(source.cover_selector, COVER_JS)
+        return img_src
+
+    # resolves every name one after another: name -> (source, url, filename)
+    def _lookup_all(self, names):
+        self._prefetch_indexes()
+        jobs = {}
+        for name in names:
+            norm_name = self._normalize_text(name)
+            print(f"\n🔎 Processing: {name}")
+            
+            # sources are tried in priority order (Frontpages, then Zougla), exact names
+            # first, the first hit wins
+            for source, fuzzy in self._search_order():
+                job = self._search(source, norm_name, fuzzy)
+                if job: 
+                    jobs[name] = (source.name, *job)
+                    break
+        return jobs
+
+    # --- Manifest ---
+    def _load_manifest(self):
+        try:
+            with open(self.manifest_path, encoding='utf-8') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            print(f"⚠️ Could not read manifest, starting fresh: {e}")
+            return {}
+
+    def _save_manifest(self):
+        # write to a temp file first so a crash never leaves half a manifest behind
+        tmp_path = self.manifest_path + ".tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.manifest, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+
+    def _record(self, name, source, url, result):
+        path, digest = result if result else (None, None)
+        self.manifest[self._normalize_text(name)] = {
+            "name": name,
+            "source": source,
+            "url": url,
+            "path": os.path.basename(path) if path else None,
+            "sha256": digest,
+            "status": "ok" if result else ("failed" if url else "not_found"),
+            "updated": datetime.now().isoformat(timespec='seconds'),
+        }
+
+    def _is_complete(self, name):
+        entry = self.manifest.get(self._normalize_text(name))
+        return bool(entry and entry["status"] == "ok"
+                    and os.path.exists(os.path.join(self.today_dir, entry["path"])))
+
+    # completed covers in CSV order, or in manifest order when no list is given
+    def _manifest_images(self, names=None):
+        keys = [self._normalize_text(name) for name in names] if names else list(self.manifest)
+        images = []
+        for key in dict.fromkeys(keys):
+            entry = self.manifest.get(key)
+            if entry and entry["status"] == "ok":
+                path = os.path.join(self.today_dir, entry["path"])
+                if os.path.exists(path): images.append(path)
+        return images
+
     def generate_pdf(self):
+        # a standalone call rebuilds today's PDF from the manifest
+        if not self.downloaded_images:
+            self.downloaded_images = self._manifest_images()
         if not self.downloaded_images:
             print("⚠️ No images to create PDF.")
             return
-        print(f"\n📄 Creating PDF from {len(self.downloaded_images)} images...")
         pdf_path = os.path.join(self.today_dir, f"Papers_{datetime.now().strftime('%Y-%m-%d')}.pdf")
         try:
-            images = []
-            for path in self.downloaded_images:
-                try:
-                    # Open and convert to RGB, required for saving as PDF
-                    img = Image.open(path).convert('RGB')
-                    images.append(img)
-                except Exception as e: 
-                    print(f"    ❌ Could not process image {os.path.basename(path)} for PDF: {e}")
-            
-            if images:
-                # Save the first image, appending the rest
-                images[0].save(pdf_path, "PDF", resolution=300.0, save_all=True, append_images=images[1:])
-                print(f"✅ PDF Saved: {pdf_path}")
+            with self.stats.span("pdf"):
+                self._build_pdf(pdf_path)
         except Exception as e:
             print(f"❌ PDF Failed: {e}")
 
+    # --- Archive ---
+    # packs every day folder older than `days` days into the monthly archives
+    def compact(self, days=30):
+        cutoff = date.today().toordinal() - max(1, days)
+        folders = []
+        for day_name in os.listdir(self.root_dir):
+            try:
+                day = datetime.strptime(day_name, '%Y-%m-%d').date()
+            except ValueError:
+                continue
+            if day.toordinal() < cutoff: folders.append(os.path.join(self.root_dir, day_name))
+        if not folders:
+            print(f"✅ Nothing older than {days} days to compact.")
+            return
+        print(f"🗜️  Packing {len(folders)} days into {self.archive.archive_dir}...")
+        try:
+            packed, stored = self.archive.pack(folders)
+            removed, freed = self.blobs.prune(keep=self.image_cache.digests())
+            print(f"✅ Packed {len(packed)} days ({stored} new files), "
+                  f"released {removed} blobs ({freed / (1024 * 1024):.1f} MB)")
+        except Exception as e:
+            print(f"❌ Compaction failed: {e}")
+
+    def restore_day(self, day):
+        dest_dir = os.path.join(self.root_dir, day)
+        try:
+            if self.archive.restore(day, dest_dir):
+                print(f"✅ Restored {day} into {dest_dir}")
+            else:
+                print(f"⚠️ {day} is not in the archive.")
+        except Exception as e:
+            print(f"❌ Restore failed: {e}")
+
+    # --- Stale Covers ---
+    # an undated listing entry may still show an older cover (_check_date_generic lets it
+    # through), so new downloads are compared with the earlier days of the same title
+    def _flag_stale(self, names):
+        try:
+            with self.stats.span("stale_check"):
+                if self.cover_hashes is None:
+                    self.cover_hashes = CoverHashes(self.hashes_path, self.root_dir)
+                today = date.today().toordinal()
+                for name in names:
+                    entry = self.manifest.get(self._normalize_text(name))
+                    if not entry or entry["status"] != "ok": continue
+                    key = cover_key(entry["path"])
+                    digest = cover_hash(os.path.join(self.today_dir, entry["path"]))
+                    seen = self.cover_hashes.seen(key, entry["sha256"], digest, today)
+                    if seen is None:
+                        self.cover_hashes.add(key, today, entry["sha256"], digest)
+                        continue
+                    entry["stale_of"], entry["stale_match"] = date.fromordinal(seen[0]).isoformat(), seen[1]
+                    self.stats.count("stale_covers")
+                    same = "same cover as" if seen[1] == "exact" else "looks like the cover of"
+                    if self.drop_stale:
+                        # not complete, so the next run looks for a newer cover again
+                        entry["status"] = "stale"
+                        print(f"🕰️  {name}: {same} {entry['stale_of']}, left out of the PDF")
+                    else:
+                        print(f"🕰️  {name}: {same} {entry['stale_of']}")
+                self.cover_hashes.save()
+        except Exception as e:
+            print(f"⚠️ Stale cover check failed: {e}")
+
+    # --- Derivatives ---
+    # resizing and encoding is CPU bound, the covers are spread over all cores
+    def generate_derivatives(self):
+        from PIL import features
+        images = self.downloaded_images or self._manifest_images()
+        if not images: return
+        out_dir = os.path.join(self.today_dir, "derivatives")
+        os.makedirs(out_dir, exist_ok=True)
+        # the extensions double as Pillow feature names ("jpg", "webp", "avif")
+        formats = [fmt for fmt, (ext, quality) in DERIVATIVE_FORMATS.items() if features.check(ext)]
+        for fmt in DERIVATIVE_FORMATS:
+            if fmt not in formats: print(f"⚠️ This Pillow build cannot write {fmt.upper()}, skipping it.")
+        print(f"\n🖼️  Creating derivatives of {len(images)} covers...")
+        written = 0
+        with self.stats.span("derivatives"):
+            with ProcessPoolExecutor(max_workers=min(len(images), os.cpu_count() or 1)) as pool:
+                futures = {pool.submit(make_derivatives, path, out_dir, DERIVATIVE_WIDTHS, formats): path
+                           for path in images}
+                for future, path in futures.items():
+                    try:
+                        written += future.result()
+                    except Exception as e:
+                        print(f"    ⚠️ Derivatives failed for {os.path.basename(path)}: {e}")
+        self.stats.count("derivatives", written)
+        print(f"✅ {written} derivatives saved in {out_dir}")
+
+    def _build_pdf(self, pdf_path):
+        import img2pdf, pikepdf
+        covers = [(path, self._cover_digest(path)) for path in self.downloaded_images]
+        if self.incremental_pdf and os.path.exists(pdf_path) and self._append_pdf(pdf_path, covers):
+            return
+        print(f"\n📄 Creating PDF from {len(covers)} images...")
+        sources, stamped = self._pdf_sources(covers)
+        if sources:
+            # JPEG bytes are embedded as they are, 300 dpi keeps the old page size. img2pdf
+            # builds in memory, so the stamped PDF is written to disk only once
+            layout = img2pdf.get_fixed_dpi_layout_fun(PDF_DPI)
+            with pikepdf.open(io.BytesIO(img2pdf.convert(sources, layout_fun=layout))) as pdf:
+                self._stamp_covers(pdf, stamped)
+                pdf.save(pdf_path)
+            print(f"✅ PDF Saved: {pdf_path}")
+
+    # adds only the covers missing from an existing PDF, in CSV position.
+    # returns False when the PDF has to be rebuilt (a cover changed, vanished or moved)
+    def _append_pdf(self, pdf_path, covers):
+        import img2pdf, pikepdf
+        with pikepdf.open(pdf_path, allow_overwriting_input=True) as pdf:
+            try:
+                existing = [tuple(c) for c in json.loads(str(pdf.docinfo.get("/FPCovers", "[]")))]
+            except ValueError:
+                return False
+            wanted = [(os.path.basename(path), digest) for path, digest in covers]
+            if len(existing) != len(pdf.pages) or [c for c in wanted if c in existing] != existing:
+                return False
+
+            new = [cover for cover, key in zip(covers, wanted) if key not in existing]
+            if not new:
+                print(f"\n✅ PDF already up to date: {pdf_path}")
+                return True
+            print(f"\n📄 Appending {len(new)} new covers to {os.path.basename(pdf_path)}...")
+            sources, added = self._pdf_sources(new)
+            if not sources: return True
+
+            with pikepdf.open(io.BytesIO(img2pdf.convert(sources, layout_fun=img2pdf.get_fixed_dpi_layout_fun(PDF_DPI)))) as new_pdf:
+                added_keys = [(os.path.basename(path), digest) for path, digest in added]
+                final = [key for key in wanted if key in existing or key in added_keys]
+                new_pages = iter(new_pdf.pages)
+                for position, key in enumerate(final):
+                    if key not in existing:
+                        pdf.pages.insert(position, next(new_pages))
+                self._stamp_covers(pdf, [cover for cover in covers
+                                         if (os.path.basename(cover[0]), cover[1]) in final])
+                pdf.save(pdf_path)
+        print(f"✅ PDF Updated: {pdf_path}")
+        return True
+
+    # page sources for img2pdf plus the covers that made it, unreadable images are skipped
+    def _pdf_sources(self, covers):
+        sources, kept = [], []
+        for path, digest in covers:
+            try:
+                sources.append(self._pdf_page_source(path))
+                kept.append((path, digest))
+            except Exception as e: 
+                print(f"    ❌ Could not process image {os.path.basename(path)} for PDF: {e}")
+        return sources, kept
+
+    # the PDF remembers which cover every page holds, so the next run knows what to append
+    def _stamp_covers(self, pdf, covers):
+        import pikepdf
+        keys = [[os.path.basename(path), digest] for path, digest in covers]
+        pdf.docinfo[pikepdf.Name("/FPCovers")] = json.dumps(keys)
+
+    def _cover_digest(self, path):
+        name = os.path.basename(path)
+        for entry in self.manifest.values():
+            if entry.get("path") == name and entry.get("sha256"):
+                return entry["sha256"]
+        return file_digest(path)
+
+    # JPEGs go into the PDF untouched, only other formats/modes are decoded and converted
+    def _pdf_page_source(self, path):
+        from PIL import Image
+        # opening only reads the header, pixels are decoded on convert()
+        with Image.open(path) as img:
+            if img.format == "JPEG" and img.mode in ("RGB", "L"):
+                return path
+            print(f"    🔄 Converting {os.path.basename(path)} ({img.format}, {img.mode}) for PDF...")
+            buffer = io.BytesIO()
+            img.convert('RGB').save(buffer, "JPEG", quality=95)
+            return buffer.getvalue()
+
     def run(self):
+        self.stats = RunStats()
+        try:
+            with self.stats.span("run"):
+                finished = self._run()
+        finally:
+            self._write_report()
+        if finished:
+            print("\n✨ Process finished.")
+            self._pause(3) # Pause briefly at the end to identify errors
+
+    # one JSON line per run, next to the daily PDF
+    def _write_report(self):
+        try:
+            report = self.stats.report(engine=self.engine, lean=self.lean,
+                                       breakers={name: breaker.summary() for name, breaker in self.breakers.items()})
+            with open(self.report_path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(report, ensure_ascii=False) + "\n")
+            print(f"📊 Run report: {self.report_path}")
+        except Exception as e:
+            print(f"⚠️ Could not write run report: {e}")
+
+    def _run(self):
         # Check if the external CSV file exists before attempting to read
         if not os.path.exists(self.csv_path):
             print(f"🛑 ERROR: Required data file not found.")
             print(f"Please ensure '{os.path.basename(self.csv_path)}' is in the same folder as the executable.")
-            time.sleep(10) # Pause so the user can see the error
+            self._pause(10) # Pause so the user can see the error
             return
 
         NEWSPAPER_LIST = self._read_target_newspapers(self.csv_path)
         if not NEWSPAPER_LIST: return
+        self.stats.count("titles", len(NEWSPAPER_LIST))
 
-        with sync_playwright() as p:
-            print("🚀 Launching scraper...")
-            
-            browser = None
-            # 5. CRITICAL: Try system-installed browsers (Chrome first, then Edge)
-            # NOTE: If you bundled the browser using PLAYWRIGHT_BROWSERS_PATH=0, 
-            # Playwright will automatically find the bundled browser here.
+        # titles finished by an earlier run today are not looked up again
+        pending = [name for name in NEWSPAPER_LIST if not self._is_complete(name)]
+        if len(pending) < len(NEWSPAPER_LIST):
+            print(f"♻️  {len(NEWSPAPER_LIST) - len(pending)} newspapers already done today, skipping them.")
+
+        if pending: self._probe_sources()
+        return self._process(NEWSPAPER_LIST, pending)
+
+    # looks up and downloads the pending titles, then refreshes the PDF of all names
+    def _process(self, names, pending):
+        self.targets = [self._normalize_text(name) for name in pending]
+        if pending:
             try:
-                browser = p.chromium.launch(headless=True, channel="chrome")
-            except Exception:
-                print("⚠️ Google Chrome not found, trying Microsoft Edge...")
+                if self.workers > 1 and len(pending) > 1:
+                    results = self._fetch_sharded(pending)
+                else:
+                    print(f"🚀 Launching scraper ({self.engine} engine)...")
+                    results = self._fetch_covers(pending)
+                if results is None:
+                    self._pause(10)
+                    return
+
+                # titles of a shard that failed twice stay pending for the next run
+                for name in pending:
+                    if name in results: self._record(name, *results[name])
+                self._flag_stale(list(results))
+                self._save_manifest()
+            finally:
+                if not self.watching: self._close_browser()
+                self._report_breakers()
+
+        self.downloaded_images = self._manifest_images(names)
+        self.stats.count("covers", len(self.downloaded_images))
+        for name in names:
+            if self.manifest.get(self._normalize_text(name), {}).get("status") == "stale":
+                print(f"🕰️  Only an older cover found: {name}")
+            elif not self._is_complete(name):
+                print(f"❌ Not found: {name}")
+
+        self.generate_pdf()
+        if self.derivatives:
+            self.generate_derivatives()
+        return True
+
+    # lookups and downloads of the given titles, without touching the manifest:
+    # {name: (source, url, (path, sha256) or None)}, or None when no browser could be started
+    def _fetch_covers(self, names):
+        with self.stats.span("lookup"):
+            if self.engine == "async":
+                jobs = AsyncLookup(self, self.async_pages).resolve(names)
+            else:
+                jobs = self._lookup_all(names) if self._browser_ready() else None
+        if jobs is None: return None
+
+        print(f"\n⬇️  Downloading {len(jobs)} covers...")
+        saved = dict(zip(jobs, self._download_all([job[1:] for job in jobs.values()])))
+        results = {name: (None, None, None) for name in names}
+        for name, (source, url, _) in jobs.items():
+            results[name] = (source, url, saved[name])
+
+        # a failed download still gets its chance on the next sources (Frontpages -> Zougla)
+        retry, order = {}, self._search_order()
+        for name, (source_name, url, filename) in jobs.items():
+            if saved[name] is not None: continue
+            norm_name = self._normalize_text(name)
+            # only what comes after the failed (source, fuzzy) pair in the search order
+            failed = self.sources_by_name[source_name]
+            for source, fuzzy in order[order.index((failed, not self._has_entry(failed, norm_name))) + 1:]:
+                if source.name == source_name: continue
+                job = self._search(source, norm_name, fuzzy)
+                if job:
+                    retry[name] = (source.name, *job)
+                    break
+        for name, result in zip(retry, self._download_all([job[1:] for job in retry.values()])):
+            results[name] = (retry[name][0], retry[name][1], result)
+        return results
+
+    # --workers: the titles are dealt round-robin to worker processes, each with its own
+    # bot and browser. results come back through a queue, the manifest and the PDF stay
+    # with this process. a shard whose worker fails or crashes is retried once on its own
+    def _fetch_sharded(self, pending):
+        import queue as queues
+        shards = {shard: pending[shard::self.workers] for shard in range(min(self.workers, len(pending)))}
+        print(f"🚀 Launching {len(shards)} workers ({self.engine} engine)...")
+        context = multiprocessing.get_context("spawn")
+        messages = context.Queue()
+        sources = [vars(source) for source in self.sources_by_name.values()]
+        tripped = [name for name, breaker in self.breakers.items() if breaker.state == "open"]
+        options = self._worker_options()
+        results, attempts, running, finished = {}, {}, {}, set()
+
+        def start(shard):
+            attempts[shard] = attempts.get(shard, 0) + 1
+            process = context.Process(target=shard_worker, daemon=True,
+                                      args=(shard, shards[shard], self.targets, options, sources, tripped, messages))
+            process.start()
+            running[shard] = process
+
+        def failed(shard, reason):
+            running.pop(shard).join()
+            self.stats.count("worker_failures")
+            if attempts[shard] < 2:
+                print(f"⚠️ Worker {shard + 1} failed ({reason}), retrying its {len(shards[shard])} titles...")
+                start(shard)
+            else:
+                print(f"❌ Worker {shard + 1} failed again ({reason}), its titles wait for the next run.")
+
+        with self.stats.span("shards"):
+            for shard in shards: start(shard)
+            while running:
                 try:
-                    browser = p.chromium.launch(headless=True, channel="msedge")
-                except Exception:
-                    # Fallback if both system browsers fail (Playwright will try its own bundled browser if one exists)
-                    try:
-                        print("⚠️ Neither system browser found. Attempting to launch generic bundled Chromium...")
-                        browser = p.chromium.launch(headless=True)
-                    except Exception:
-                        print("🛑 ERROR: Failed to launch any Chromium browser.")
-                        print("👉 Please ensure Chrome/Edge is installed or that you bundled a Playwright browser.")
-                        time.sleep(10)
-                        return
-                    
-            if browser:
-                # Use a new context to avoid sharing cookies/cache between runs
-                page = browser.new_context().new_page()
-                
-                for name in NEWSPAPER_LIST:
-                    norm_name = self._normalize_text(name)
-                    print(f"\n🔎 Processing: {name}")
-                    
-                    # Search Frontpages first
-                    result = self._search_frontpages(page, norm_name)
-                    
-                    # If not found, search Zougla
-                    if not result: 
-                        result = self._search_zougla(page, norm_name)
-                    
-                    if result: 
-                        self.downloaded_images.append(result)
-                    else: 
-                        print(f"❌ Not found: {name}")
+                    message = messages.get(timeout=1)
+                except queues.Empty:
+                    # a worker that died without a word (crashed browser, killed process)
+                    for shard, process in list(running.items()):
+                        if not process.is_alive() and shard not in finished:
+                            failed(shard, f"exit code {process.exitcode}")
+                    continue
+                kind, shard = message[0], message[1]
+                if kind == "result":
+                    results[message[2]] = message[3]
+                elif kind == "stats":
+                    self.stats.merge(message[2], message[3])
+                elif kind == "done":
+                    finished.add(shard)
+                    running.pop(shard).join()
+                elif kind == "error" and shard in running:
+                    failed(shard, message[2])
+        return results
 
-                browser.close()
-                self.generate_pdf()
-            
-        print("\n✨ Process finished.")
-        time.sleep(3) # Pause briefly at the end to identify errors
+    def _worker_options(self):
+        return dict(engine=self.engine, download_workers=self.download_workers,
+                    per_host_downloads=self.per_host_downloads, async_pages=self.async_pages,
+                    cache_mb=self.image_cache.max_bytes // (1024 * 1024), match_threshold=self.match_threshold,
+                    lean=self.lean, listing_ttl=self.listing_cache.ttl,
+                    application_path=self.application_path, pause=False)
+
+    # --- Watch Mode ---
+    # stays alive and polls the listings: only titles whose listing entry changed, whose
+    # download failed or that no cycle finished yet are looked up, then the PDF is refreshed.
+    # the interval halves after a listing change and grows while nothing happens
+    def watch(self, interval=300, min_interval=60, max_interval=1800):
+        print(f"👀 Watching the listings every {interval}s to start with (Ctrl+C to stop)...")
+        self.watching = True
+        signatures, first = {}, True
+        try:
+            while True:
+                self.stats = RunStats()
+                looked_up = changed = False
+                try:
+                    # a new day starts with its own folder, manifest and a full pass
+                    if self._setup_directory() != self.today_dir:
+                        self._start_day()
+                        signatures, first = {}, True
+                    with self.stats.span("run"):
+                        looked_up, changed = self._watch_cycle(signatures, first)
+                    first = False
+                except Exception as e:
+                    # a bad cycle (site, disk, listing cache) is retried at the next check
+                    print(f"⚠️ [{datetime.now():%H:%M}] Watch cycle failed, trying again at the next check: {e}")
+                finally:
+                    if looked_up: self._write_report()
+                interval = max(min_interval, interval // 2) if changed else min(max_interval, int(interval * 1.5))
+                print(f"💤 Next check in {interval}s")
+                time.sleep(interval)
+        except KeyboardInterrupt:
+            print("\n👋 Stopped watching.")
+        finally:
+            self.watching = False
+            self._close_browser()
+
+    def _start_day(self):
+        self.today_dir = self._setup_directory()
+        self.report_path = os.path.join(self.today_dir, "run_reports.jsonl")
+        self.manifest_path = os.path.join(self.today_dir, "manifest.json")
+        self.manifest = self._load_manifest()
+        self.downloaded_images = []
+
+    # one poll, returns (something was looked up, a listing changed)
+    def _watch_cycle(self, signatures, first):
+        if not os.path.exists(self.csv_path):
+            print(f"🛑 ERROR: {os.path.basename(self.csv_path)} not found.")
+            return False, False
+        names = self._read_target_newspapers(self.csv_path)
+        if not names: return False, False
+        self.listing_index, self.fuzzy_matches = {}, {}
+        self.targets = [self._normalize_text(name) for name in names]
+        self._probe_sources()
+        polled = self._poll_listings()
+
+        pending, retries, seen = [], [], {}
+        for name in names:
+            key = self._normalize_text(name)
+            seen[key] = tuple((source.name, self._listing_signature(source, key, polled)) for source in self.sources)
+            if first:
+                if not self._is_complete(name): pending.append(name)
+            elif signatures.get(key) != seen[key]:
+                pending.append(name)
+            elif self.manifest.get(key, {"status": "failed"})["status"] == "failed":
+                # the listing is the same, but the download failed (or never finished)
+                retries.append(name)
+        if not pending and not retries:
+            print(f"💤 [{datetime.now():%H:%M}] No listing changes")
+            signatures.update(seen)
+            return False, False
+        if pending:
+            print(f"\n🔔 [{datetime.now():%H:%M}] {len(pending)} newspapers new or changed on the listings")
+        if retries:
+            print(f"\n🔁 [{datetime.now():%H:%M}] Retrying {len(retries)} failed downloads")
+        self.stats.count("titles", len(names))
+        self._process(names, pending + retries)
+        # only a finished cycle moves the signatures, a failed one looks at the same titles again
+        signatures.update(seen)
+        return True, bool(pending)
+
+    # one static GET per listing. pages the HTML parser understands give per-title entries
+    # (also reused for the lookups), the others are fingerprinted as a whole page
+    def _poll_listings(self):
+        # a broken listing cache only costs the sharing with other runs
+        def update_cache(update, *args):
+            try:
+                update(*args)
+            except sqlite3.Error as e:
+                print(f"    ⚠️ Listing cache unavailable: {e}")
+        def poll(source):
+            if not self._source_allowed(source): return None
+            try:
+                html = self._fetch_html(source.listing_url, source)
+            except Exception as e:
+                print(f"    ⚠️ Could not poll {source.label}: {e}")
+                return None
+            entries = source.parse_entries(html)
+            index = self._index_entries(entries, source)
+            if index:
+                self.listing_index[source.name] = index
+                update_cache(self.listing_cache.put, source, entries)
+                return index
+            digest = hashlib.sha256(html).hexdigest()
+            # the browser has to look at a changed page again
+            if self._listing_hashes.get(source.name) != digest:
+                self._listing_hashes[source.name] = digest
+                update_cache(self.listing_cache.invalidate, source)
+            return digest
+        with self.stats.span("poll"), ThreadPoolExecutor(max_workers=len(self.sources) or 1) as pool:
+            return {source.name: result for source, result in zip(self.sources, pool.map(poll, self.sources))}
+
+    def _listing_signature(self, source, key, polled):
+        listing = polled.get(source.name)
+        if not isinstance(listing, dict): return listing
+        if key in listing: return listing[key]
+        match = self._fuzzy_matches(source, key).get(key)
+        return listing[match] if match else None
+
+# entry point of a --workers process: its own bot and browser for one shard of titles.
+# the parent's sources (with any overrides) and open circuits are handed over as they are,
+# and fuzzy matching sees every pending title like a single process would
+def shard_worker(shard, names, targets, options, sources, tripped, messages):
+    try:
+        bot = NewspaperBot(**options)
+        bot.sources_by_name = {config["name"]: Source(**config) for config in sources}
+        bot.sources = [source for source in bot.sources_by_name.values() if source.enabled]
+        bot.breakers = {source.name: CircuitBreaker() for source in bot.sources}
+        for name in tripped: bot.breakers[name].trip()
+        bot.targets = targets
+        try:
+            results = bot._fetch_covers(names)
+        finally:
+            bot._close_browser()
+        if results is None: raise RuntimeError("no browser could be started")
+        for name, result in results.items():
+            messages.put(("result", shard, name, result))
+        messages.put(("stats", shard, bot.stats.spans, bot.stats.counters))
+        messages.put(("done", shard))
+    except Exception as e:
+        messages.put(("error", shard, str(e)))
+
+class AsyncLookup:
+    # runs the source chain of every title concurrently on a small pool of pages,
+    # NewspaperBot stays the entry point and hands over its listing index and helpers
+    def __init__(self, bot, pages=4):
+        self.bot = bot
+        self.pages = max(1, pages)
+
+    # same result as NewspaperBot._lookup_all, or None when no browser could be launched
+    def resolve(self, names):
+        import asyncio
+        return asyncio.run(self._resolve_all(names))
+
+    async def _resolve_all(self, names):
+        import asyncio
+        from playwright.async_api import async_playwright
+        async with async_playwright() as p:
+            print("🚀 Launching browser...")
+            with self.bot.stats.span("browser_launch"):
+                browser = await self._launch(p)
+            if browser is None: return None
+            try:
+                context = await browser.new_context()
+                self._pool = asyncio.Queue()
+                for _ in range(self.pages):
+                    page = await context.new_page()
+                    if self.bot.lean: await self._make_lean(page)
+                    self._pool.put_nowait(page)
+                self._limit = asyncio.Semaphore(self.pages)
+                # every listing starts loading right away, the titles wait for them in priority order
+                self._indexes = {source.name: asyncio.create_task(self._index(source))
+                                 for source in self.bot.sources}
+                try:
+                    results = await asyncio.gather(*(self._resolve_one(name) for name in names))
+                finally:
+                    # listings nobody needed anymore are cancelled
+                    for task in self._indexes.values(): task.cancel()
+                    await asyncio.gather(*self._indexes.values(), return_exceptions=True)
+            finally:
+                await browser.close()
+        return {name: job for name, job in zip(names, results) if job}
+
+    async def _launch(self, p):
+        # same sequence as the sync engine: the warm daemon, then the channels
+        endpoint = self.bot._daemon_endpoint()
+        if endpoint:
+            try:
+                browser = await p.chromium.connect_over_cdp(endpoint, timeout=3000)
+                print(f"🔌 Connected to the running browser at {endpoint}")
+                return browser
+            except Exception:
+                print("⚠️ Browser daemon not reachable, launching a new browser...")
+        for channel in self.bot._launch_order():
+            try:
+                browser = await p.chromium.launch(headless=True, channel=channel)
+                self.bot._remember_channel(channel)
+                return browser
+            except Exception:
+                print(f"⚠️ {CHANNEL_LABELS[channel]} not found, trying the next browser...")
+        print("🛑 ERROR: Failed to launch any Chromium browser.")
+        return None
+
+    async def _make_lean(self, page):
+        stats = self.bot._lean_stats(page)
+        async def handle(route):
+            if self.bot._should_block(route.request):
+                stats["blocked"] += 1
+                await route.abort()
+            else:
+                await route.continue_()
+        await page.route("**/*", handle)
+
+    async def _goto(self, page, url, source, selector):
+        self.bot.stats.count(f"page_loads.{source.name}")
+        kind = "goto.listing" if selector == source.entry_selector else "goto.detail"
+        with self.bot.stats.span(f"navigate.{source.name}"), self.bot._guarded(source, kind) as timeout:
+            if not self.bot.lean:
+                await page.goto(url, timeout=timeout(60000, FULL_NAVIGATION_FLOOR))
+                return
+            started = self.bot._reset_nav_stats(page)
+            await page.goto(url, wait_until="domcontentloaded", timeout=timeout(source.timeout))
+            await page.wait_for_selector(selector, state="attached", timeout=timeout(source.timeout))
+            self.bot._report_navigation(page, source, started)
+
+    # borrows a page from the pool, the semaphore caps how many lookups navigate at once
+    @contextlib.asynccontextmanager
+    async def _page(self):
+        async with self._limit:
+            page = await self._pool.get()
+            try:
+                yield page
+            finally:
+                self._pool.put_nowait(page)
+
+    # one task per listing, every title awaits the same index
+    async def _index(self, source):
+        import asyncio
+        started = time.perf_counter()
+        cache = self.bot.listing_cache
+        try:
+            # same lease as NewspaperBot._build_index, waiting without blocking the other lookups
+            entries = cache.get(source)
+            while entries is None and not cache.acquire(source):
+                await asyncio.sleep(0.5)
+                entries = cache.get(source)
+            if entries is not None:
+                self.bot.stats.count(f"listing_cache_hits.{source.name}")
+                print(f"    ♻️ Reusing the cached {source.label} listing")
+            else:
+                entries = await self._load_entries(source)
+                if entries: cache.put(source, entries)
+                else: cache.release(source)
+        except sqlite3.Error as e:
+            print(f"    ⚠️ Listing cache unavailable: {e}")
+            entries = await self._load_entries(source)
+        index = self.bot._index_entries(entries, source)
+        print(f"    ✅ Indexed {len(index)} entries from {source.label}")
+        self.bot.stats.add_time(f"index.{source.name}", time.perf_counter() - started)
+        self.bot.listing_index[source.name] = index
+        return index
+
+    async def _load_entries(self, source):
+        if not self.bot._source_allowed(source): return []
+        print(f"    📚 Indexing {source.label}...")
+        try:
+            async with self._page() as page:
+                await self._goto(page, source.listing_url, source, source.entry_selector)
+                self.bot.stats.count("locator_calls")
+                return await page.eval_on_selector_all(source.entry_selector, ENTRIES_JS, source.selectors)
+        except Exception as e:
+            print(f"    ⚠️ Could not index {source.label}: {e}")
+            return []
+
+    async def _resolve_one(self, name):
+        norm_name = self.bot._normalize_text(name)
+        for source, fuzzy in self.bot._search_order():
+            try:
+                await self._indexes[source.name]
+                entry = self.bot._find_entry(source, norm_name, fuzzy)
+                link = self.bot._entry_link(source, entry) if entry else None
+                if not link: continue
+                if source.cover_selector:
+                    if not self.bot._source_allowed(source): continue
+                    async with self._page() as page:
+                        await self._goto(page, link, source, source.cover_selector)
+                        self.bot.stats.count("locator_calls")
+                        img_src = await page.eval_on_selector_all(source.cover_selector, COVER_JS)
+                    if not img_src: continue
+                    link = urljoin(source.listing_url, img_src)
+                return (source.name, link, f"{norm_name}_{source.suffix}.jpg")
+            except Exception as e:
+                print(f"    ⚠️ Lookup on {source.label} failed for {name}: {e}")
+        return None
 
 if __name__ == "__main__":
-    bot = NewspaperBot()
-    bot.run()
\ No newline at end of file
+    # the derivative workers of a frozen .exe start through this same entry point
+    multiprocessing.freeze_support()
+    parser = argparse.ArgumentParser(description="Download today's newspaper front pages into a PDF.")
+    parser.add_argument("--engine", choices=ENGINES, default="playwright",
+                        help="playwright drives Chromium, http parses static HTML (browser only as fallback)")
+    parser.add_argument("--serve-browser", action="store_true",
+                        help="keep a browser running that later runs connect to instead of launching their own")
+    parser.add_argument("--browser-port", type=int, default=9222, help="debugging port of the browser daemon")
+    parser.add_argument("--pages", type=int, default=4, help="parallel browser pages for the async engine")
+    parser.add_argument("--lean", action="store_true",
+                        help="block images/fonts/third-party requests and stop waiting at DOMContentLoaded")
+    parser.add_argument("--download-workers", type=int, default=8, help="parallel image downloads")
+    parser.add_argument("--cache-mb", type=int, default=512, help="size cap of the image cache shared by runs")
+    parser.add_argument("--full-pdf", action="store_true", help="rebuild the daily PDF instead of appending new covers")
+    parser.add_argument("--match-threshold", type=float, default=0.7,
+                        help="minimum similarity (0-1) for fuzzy name matches, above 1 disables them")
+    parser.add_argument("--profile", action="store_true", help="run under cProfile and save the stats next to the PDF")
+    parser.add_argument("--per-host", type=int, default=4, help="parallel image downloads per host")
+    parser.add_argument("--listing-ttl", type=int, default=600,
+                        help="seconds a cached listing is reused by later runs, 0 disables the cache")
+    parser.add_argument("--derivatives", action="store_true",
+                        help="also save thumbnails and WebP/AVIF copies of the covers in derivatives/")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="split the newspapers over this many processes, each with its own browser")
+    parser.add_argument("--compact-days", type=int, metavar="N",
+                        help="pack the day folders older than N days into archive/YYYY-MM.zip and exit")
+    parser.add_argument("--restore-day", metavar="YYYY-MM-DD", help="unpack one archived day and exit")
+    parser.add_argument("--watch", action="store_true",
+                        help="keep running and fetch covers as soon as they show up on the listings")
+    parser.add_argument("--watch-interval", type=int, default=300, help="seconds between the first polls of --watch")
+    parser.add_argument("--drop-stale", action="store_true",
+                        help="leave covers identical to an earlier day out of the PDF instead of only flagging them")
+    args = parser.parse_args()
+
+    bot = NewspaperBot(engine=args.engine, download_workers=args.download_workers,
+                       per_host_downloads=args.per_host, async_pages=args.pages,
+                       cache_mb=args.cache_mb, incremental_pdf=not args.full_pdf,
+                       match_threshold=args.match_threshold, lean=args.lean, listing_ttl=args.listing_ttl,
+                       derivatives=args.derivatives, drop_stale=args.drop_stale, workers=args.workers)
+    if args.serve_browser:
+        bot.serve_browser(args.browser_port)
+    elif args.compact_days is not None:
+        bot.compact(args.compact_days)
+    elif args.restore_day:
+        bot.restore_day(args.restore_day)
+    elif args.watch:
+        bot.watch(args.watch_interval)
+    elif args.profile:
+        import cProfile, pstats
+        profiler = cProfile.Profile()
+        profiler.runcall(bot.run)
+        profile_path = os.path.join(bot.today_dir, f"profile_{datetime.now().strftime('%H%M%S')}.prof")
+        profiler.dump_stats(profile_path)
+        print(f"⏱️  Profile saved: {profile_path}")
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(25)
+    else:
+        bot.run()
@@ -1,12 +1,26 @@
 # -*- mode: python ; coding: utf-8 -*-
+import argparse
 from PyInstaller.utils.hooks import collect_all
 
+# pyinstaller fp_newspapers.spec               -> dist/fp_newspapers.exe (one file)
+# pyinstaller fp_newspapers.spec -- --onedir   -> dist/fp_newspapers/ (starts faster, nothing to unpack)
+parser = argparse.ArgumentParser()
+parser.add_argument("--onedir", action="store_true")
+options = parser.parse_args()
+
 datas = []
 binaries = []
 hiddenimports = ['playwright._impl.api_types']
 tmp_ret = collect_all('playwright')
 datas += tmp_ret[0]; binaries += tmp_ret[1]; hiddenimports += tmp_ret[2]
 
+# pulled in by scikit-learn/scipy/numpy/PIL but never used by the bot
+excludes = [
+    'tkinter', 'matplotlib', 'pandas', 'IPython', 'pytest', 'docutils',
+    'PIL.ImageQt', 'PIL.ImageTk', 'scipy.io.matlab',
+    'sklearn.datasets', 'sklearn.tests', 'scipy.tests', 'numpy.tests',
+]
+
 
 a = Analysis(
     ['fp_newspapers.py'],
@@ -17,29 +31,57 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=excludes,
     noarchive=False,
     optimize=0,
 )
 pyz = PYZ(a.pure)
 
-exe = EXE(
-    pyz,
-    a.scripts,
-    a.binaries,
-    a.datas,
-    [],
-    name='fp_newspapers',
-    debug=False,
-    bootloader_ignore_signals=False,
-    strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
-    console=True,
-    disable_windowed_traceback=False,
-    argv_emulation=False,
-    target_arch=None,
-    codesign_identity=None,
-    entitlements_file=None,
-)
+if options.onedir:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        [],
+        exclude_binaries=True,
+        name='fp_newspapers',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=False,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
+    coll = COLLECT(
+        exe,
+        a.binaries,
+        a.datas,
+        strip=False,
+        upx=False,
+        upx_exclude=[],
+        name='fp_newspapers',
+    )
+else:
+    exe = EXE(
+        pyz,
+        a.scripts,
+        a.binaries,
+        a.datas,
+        [],
+        name='fp_newspapers',
+        debug=False,
+        bootloader_ignore_signals=False,
+        strip=False,
+        upx=True,
+        upx_exclude=[],
+        runtime_tmpdir=None,
+        console=True,
+        disable_windowed_traceback=False,
+        argv_emulation=False,
+        target_arch=None,
+        codesign_identity=None,
+        entitlements_file=None,
+    )
@@ -0,0 +1,20 @@
+import os
+import sys
+
+import pytest
+
+# run from anywhere: the bot lives one folder up
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from fp_newspapers import NewspaperBot
+
+# saved copies of the listing and detail pages, also served by benchmarks/bench_offline.py
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+def read_fixture(name):
+    with open(os.path.join(FIXTURES_DIR, name), 'rb') as f:
+        return f.read()
+
+# a bot working in a temp folder, no console pauses
+@pytest.fixture
+def bot(tmp_path):
+    return NewspaperBot(engine="http", pause=False, application_path=str(tmp_path))
@@ -0,0 +1,60 @@
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from conftest import read_fixture
+from fp_newspapers import CircuitBreaker
+
+# answers every request at once with the saved frontpages listing
+@pytest.fixture
+def listing_url():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            body = read_fixture("frontpages.html")
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/"
+    httpd.shutdown()
+
+# fast headers say nothing about how long the whole page takes
+def test_probe_leaves_the_timeouts_alone(bot, listing_url):
+    for source in bot.sources:
+        source.listing_url = listing_url
+    bot._probe_sources()
+    for breaker in bot.breakers.values():
+        assert breaker.state == "closed"
+        assert breaker.timeout("get.listing", 30.0) == 30.0
+        assert breaker.timeout("goto.listing", 60.0) == 60.0
+
+def test_latency_is_kept_per_kind_of_request():
+    breaker = CircuitBreaker()
+    breaker.success("get.detail", 0.1)
+    assert breaker.timeout("get.detail", 30.0) == breaker.floor
+    assert breaker.timeout("goto.listing", 60.0) == 60.0
+    assert breaker.timeout("get.detail", 60.0, floor=30.0) == 30.0
+
+def test_failed_listing_load_is_tried_again(bot, monkeypatch):
+    source = bot.sources[0]
+    def fail(*args):
+        raise ConnectionError("read timed out")
+    monkeypatch.setattr(bot, "_fetch_html", fail)
+    monkeypatch.setattr(bot, "_get_page", fail)
+    assert bot._get_index(source) == {}
+    assert source.name not in bot.listing_index
+    monkeypatch.setattr(bot, "_fetch_html", lambda url, source: read_fixture("frontpages.html"))
+    assert len(bot._get_index(source)) == 21
+
+def test_open_breaker_skips_the_listing(bot, monkeypatch):
+    source = bot.sources[0]
+    bot.breakers[source.name].trip()
+    monkeypatch.setattr(bot, "_fetch_html", lambda url, source: pytest.fail("fetched while open"))
+    assert bot._get_index(source) == {}
@@ -0,0 +1,64 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+import pytest
+
+from conftest import FIXTURES_DIR
+
+with open(os.path.join(FIXTURES_DIR, "cover.jpg"), 'rb') as f:
+    COVER = f.read()
+
+# serves the fixture cover with Range support: 416 when the range starts past the end
+@pytest.fixture
+def server():
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            start = int(self.headers.get("Range", "bytes=0-")[6:].rstrip("-") or 0)
+            if start >= len(COVER):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(COVER)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            self.send_response(206 if start else 200)
+            if start: self.send_header("Content-Range", f"bytes {start}-{len(COVER) - 1}/{len(COVER)}")
+            self.send_header("ETag", '"cover"')
+            self.send_header("Content-Length", str(len(COVER) - start))
+            self.end_headers()
+            self.wfile.write(COVER[start:])
+
+        def log_message(self, *args):
+            pass
+
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/cover.jpg"
+    httpd.shutdown()
+
+def leave_part(bot, url, data):
+    part_path = os.path.join(bot.today_dir, "cover.jpg.part")
+    with open(part_path, 'wb') as f:
+        f.write(data)
+    with open(part_path + ".json", 'w', encoding='utf-8') as f:
+        json.dump({"url": url, "etag": '"cover"', "last_modified": None}, f)
+    return part_path
+
+def test_resumes_a_partial_download(bot, server):
+    part_path = leave_part(bot, server, COVER[:1000])
+    path, digest = bot._download_file(server, "cover.jpg")
+    assert digest == hashlib.sha256(COVER).hexdigest()
+    assert bot.stats.counters["bytes_downloaded"] == len(COVER) - 1000
+    assert not os.path.exists(part_path) and not os.path.exists(part_path + ".json")
+
+# a leftover .part that already holds the whole file is answered with 416
+@pytest.mark.parametrize("extra", [b"", b"trailing garbage"])
+def test_complete_leftover_part_starts_over(bot, server, extra):
+    part_path = leave_part(bot, server, COVER + extra)
+    path, digest = bot._download_file(server, "cover.jpg")
+    assert digest == hashlib.sha256(COVER).hexdigest()
+    with open(path, 'rb') as f:
+        assert f.read() == COVER
+    assert not os.path.exists(part_path) and not os.path.exists(part_path + ".json")
@@ -0,0 +1,79 @@
+import os
+
+from fp_newspapers import BlobStore, ImageCache, file_digest
+
+def cover(tmp_path, name, size):
+    path = tmp_path / name
+    path.write_bytes(name.encode() * (size // len(name)))
+    return str(path), file_digest(str(path))
+
+def image_cache(tmp_path, **kwargs):
+    return ImageCache(str(tmp_path / "cache"), BlobStore(str(tmp_path / "blobs")), **kwargs)
+
+# --workers processes each have their own ImageCache on the same folder
+def test_caches_of_several_processes_keep_every_entry(tmp_path):
+    caches = [image_cache(tmp_path) for _ in range(3)]
+    for i, cache in enumerate(caches):
+        path, digest = cover(tmp_path, f"cover{i}.jpg", 1000)
+        cache.store(f"http://example.org/{i}.jpg", path, digest, {"ETag": f'"{i}"'})
+    fresh = image_cache(tmp_path)
+    for i in range(3):
+        assert fresh.validators(f"http://example.org/{i}.jpg") == {"If-None-Match": f'"{i}"'}
+
+def test_covers_are_kept_once_in_the_blob_store(tmp_path):
+    cache = image_cache(tmp_path)
+    path, digest = cover(tmp_path, "cover.jpg", 1000)
+    cache.store("http://example.org/a.jpg", path, digest, {})
+    assert os.path.samefile(path, cache.blobs.path(digest))
+    assert not (tmp_path / "cache" / "blobs").exists()
+    restored = str(tmp_path / "restored.jpg")
+    assert cache.restore("http://example.org/a.jpg", restored) == digest
+    assert os.stat(restored).st_nlink == 3
+
+def test_least_recently_used_covers_are_evicted(tmp_path):
+    cache = image_cache(tmp_path, max_bytes=2500)
+    digests = []
+    for i in range(3):
+        path, digest = cover(tmp_path, f"cover{i}.jpg", 1000)
+        cache.store(f"http://example.org/{i}.jpg", path, digest, {"ETag": f'"{i}"'})
+        digests.append(digest)
+        if i == 0: os.remove(path)
+    assert cache.validators("http://example.org/0.jpg") == {}
+    assert not os.path.exists(cache.blobs.path(digests[0]))
+    assert cache.restore("http://example.org/2.jpg", str(tmp_path / "restored.jpg")) == digests[2]
+
+# an evicted cover a day folder still links to keeps its blob
+def test_eviction_keeps_linked_blobs(tmp_path):
+    cache = image_cache(tmp_path, max_bytes=1500)
+    paths = []
+    for i in range(2):
+        path, digest = cover(tmp_path, f"cover{i}.jpg", 1000)
+        cache.store(f"http://example.org/{i}.jpg", path, digest, {})
+        paths.append((path, digest))
+    assert cache.validators("http://example.org/0.jpg") == {}
+    assert os.path.samefile(paths[0][0], cache.blobs.path(paths[0][1]))
+
+def test_prune_keeps_blobs_the_cache_still_wants(tmp_path):
+    cache = image_cache(tmp_path)
+    kept, kept_digest = cover(tmp_path, "kept.jpg", 1000)
+    cache.store("http://example.org/kept.jpg", kept, kept_digest, {})
+    gone, gone_digest = cover(tmp_path, "gone.jpg", 1000)
+    cache.blobs.put(gone, gone_digest)
+    os.remove(kept)
+    os.remove(gone)
+    assert cache.blobs.prune(keep=cache.digests()) == (1, 1000)
+    assert os.path.exists(cache.blobs.path(kept_digest))
+    assert not os.path.exists(cache.blobs.path(gone_digest))
+
+def test_old_index_json_is_taken_over(tmp_path):
+    cache_dir = tmp_path / "cache"
+    path, digest = cover(tmp_path, "cover.jpg", 1000)
+    os.makedirs(cache_dir / "blobs")
+    os.link(path, cache_dir / "blobs" / digest)
+    (cache_dir / "index.json").write_text(
+        '{"http://example.org/a.jpg": {"sha256": "%s", "size": 1000, "etag": "\\"a\\"", "used": 1}}' % digest)
+    cache = image_cache(tmp_path)
+    assert cache.validators("http://example.org/a.jpg") == {"If-None-Match": '"a"'}
+    assert not (cache_dir / "index.json").exists()
+    assert not (cache_dir / "blobs").exists()
+    assert os.path.samefile(path, cache.blobs.path(digest))
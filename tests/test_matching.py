@@ -0,0 +1,34 @@
+from conftest import read_fixture
+
+from fp_newspapers import fuzzy_match, normalize_name
+
+def index_fixtures(bot):
+    for name, fixture in (("frontpages", "frontpages.html"), ("zougla", "zougla.html")):
+        source = bot.sources_by_name[name]
+        bot.listing_index[name] = bot._index_entries(source.parse_entries(read_fixture(fixture)), source)
+
+# lookups against the saved listings: no date check, the detail page is not fetched
+def lookup(bot, monkeypatch, names):
+    index_fixtures(bot)
+    monkeypatch.setattr(bot, "_check_date_generic", lambda text: True)
+    monkeypatch.setattr(bot, "_cover_from_detail", lambda source, url: "/cover.jpg")
+    bot.targets = [normalize_name(name) for name in names]
+    return bot._lookup_all(names)
+
+def test_fuzzy_match_is_one_to_one():
+    names = [normalize_name("Ελεύθερος Τύπος")]
+    targets = [normalize_name("Ελεύθερος Τύπος της Κυριακής"), normalize_name("Ελεύθερος Τύπος Κυριακής")]
+    matches = fuzzy_match(names, targets, 0.7)
+    assert list(matches.values()) == names
+    # the closer title gets the listing name
+    assert list(matches) == [normalize_name("Ελεύθερος Τύπος Κυριακής")]
+
+def test_exact_name_on_later_source_beats_fuzzy_match(bot, monkeypatch):
+    jobs = lookup(bot, monkeypatch, ["Ελεύθερος Τύπος της Κυριακής", "Νέα Εγνατία"])
+    assert jobs["Ελεύθερος Τύπος της Κυριακής"][0] == "zougla"
+    assert jobs["Νέα Εγνατία"][0] == "zougla"
+
+def test_fuzzy_match_when_no_source_has_the_name(bot, monkeypatch):
+    jobs = lookup(bot, monkeypatch, ["Εφημερίδα Συντακτών", "Ελεύθερος Τύπος"])
+    assert jobs["Εφημερίδα Συντακτών"][:2] == ("frontpages", "https://www.frontpages.gr/data/2026/10/16/efsynI.jpg")
+    assert jobs["Ελεύθερος Τύπος"][0] == "frontpages"
@@ -0,0 +1,85 @@
+import pytest
+
+from conftest import read_fixture
+
+from fp_newspapers import BUILTIN_SOURCES, NewspaperBot, Source
+
+FRONTPAGES = Source(**BUILTIN_SOURCES[0])
+ZOUGLA = Source(**BUILTIN_SOURCES[1])
+
+# --- Frontpages.gr ---
+def test_frontpages_entries():
+    entries = FRONTPAGES.parse_entries(read_fixture("frontpages.html"))
+    # 20 papers, the ad slot, yesterday's Καθημερινή and Documento
+    assert len(entries) == 23
+    assert entries[0] == {"name": "Καθημερινή", "date": "16/10", "url": "/data/2026/10/16/kathimerini300.jpg"}
+    assert entries[14]["name"] == "ΝΕΑ ΕΓΝΑΤΙΑ - Θεσ/νίκη"
+
+def test_frontpages_entry_without_name():
+    ad = FRONTPAGES.parse_entries(read_fixture("frontpages.html"))[6]
+    assert ad == {"name": None, "date": "", "url": "/ads/banner_300x250.gif"}
+
+def test_frontpages_cover_url():
+    assert (FRONTPAGES.cover_url("/data/2026/10/16/kathimerini300.jpg")
+            == "https://www.frontpages.gr/data/2026/10/16/kathimeriniI.jpg")
+    # only the 300px thumbnails have a known high-res counterpart
+    assert FRONTPAGES.cover_url("/data/2026/10/11/documento150.jpg") is None
+
+def test_frontpages_date_is_kept_as_is():
+    assert FRONTPAGES.parse_date("16/10") == "16/10"
+
+# --- Zougla.gr ---
+def test_zougla_entries():
+    entries = ZOUGLA.parse_entries(read_fixture("zougla.html"))
+    assert len(entries) == 14
+    first = entries[0]
+    assert first["name"] == "Καθημερινή"
+    assert first["url"] == "/newspapers/kathimerini/2026-10-16/"
+    # the date text is the whole info block, parse_date picks the date out of it
+    assert "Παρασκευή 16/10/2026" in first["date"]
+
+def test_zougla_entry_without_link():
+    entry = ZOUGLA.parse_entries(read_fixture("zougla.html"))[4]
+    assert entry["name"] == "Απογευματινή"
+    assert entry["url"] is None
+
+def test_zougla_parse_date():
+    entries = ZOUGLA.parse_entries(read_fixture("zougla.html"))
+    assert ZOUGLA.parse_date(entries[0]["date"]) == "16/10/2026"
+    assert ZOUGLA.parse_date(entries[-1]["date"]) == ""
+    assert ZOUGLA.parse_date("Κυριακή 11/10/2026") == "11/10/2026"
+
+def test_zougla_detail_and_cover():
+    assert ZOUGLA.detail_url("/newspapers/kathimerini/2026-10-16/") == \
+        "https://www.zougla.gr/newspapers/kathimerini/2026-10-16/"
+    # the first image inside the cover block, not the logo, arrows or related covers
+    assert ZOUGLA.parse_cover(read_fixture("zougla_detail.html")) == "/images/newspapers/2026/10/16/kathimerini.jpg"
+    assert ZOUGLA.parse_cover(read_fixture("zougla.html")) is None
+
+# the async engine's download fallback runs with its browser closed, no new one for a detail page
+def test_detail_cover_without_a_browser(tmp_path, monkeypatch):
+    bot = NewspaperBot(engine="async", pause=False, application_path=str(tmp_path))
+    monkeypatch.setattr(bot, "_fetch_html", lambda url, source: read_fixture("zougla_detail.html"))
+    monkeypatch.setattr(bot, "_get_page", lambda: pytest.fail("browser launched"))
+    source = bot.sources_by_name["zougla"]
+    assert bot._cover_from_detail(source, source.detail_url("/newspapers/kathimerini/2026-10-16/")) == \
+        "/images/newspapers/2026/10/16/kathimerini.jpg"
+
+# --- Listing index ---
+def test_index_frontpages(bot):
+    source = bot.sources_by_name["frontpages"]
+    index = bot._index_entries(source.parse_entries(read_fixture("frontpages.html")), source)
+    # nameless ad dropped, the later Καθημερινή loses to the first one
+    assert len(index) == 21
+    assert index["καθημερινη"] == ("16/10", "/data/2026/10/16/kathimerini300.jpg")
+    assert "νεα εγνατια  θεσνικη" in index
+    assert index["real news"][1] == "/data/2026/10/16/realnews300.jpg"
+
+def test_index_zougla(bot):
+    source = bot.sources_by_name["zougla"]
+    index = bot._index_entries(source.parse_entries(read_fixture("zougla.html")), source)
+    # the entry without a link is left out
+    assert "απογευματινη" not in index
+    assert len(index) == 13
+    assert index["ελευθερος τυπος της κυριακης"] == ("11/10/2026", "/newspapers/eleftheros-typos-kyriakis/2026-10-16/")
+    assert index["στοχος"] == ("", "/newspapers/stochos/")
@@ -0,0 +1,70 @@
+import os
+import shutil
+from datetime import date
+
+from PIL import Image, ImageDraw
+
+from conftest import FIXTURES_DIR
+from fp_newspapers import CoverHashes, cover_hash, file_digest
+
+COVER = os.path.join(FIXTURES_DIR, "cover.jpg")
+TODAY = date(2026, 10, 16).toordinal()
+
+# the fixture cover saved again at another size and quality, the way a site re-serves it
+def reencoded(tmp_path):
+    path = str(tmp_path / "reencoded.jpg")
+    with Image.open(COVER) as img:
+        img.resize((img.width // 2, img.height // 2)).save(path, "JPEG", quality=60)
+    return path
+
+# same layout, other headline blocks: the next day of the same paper
+def next_edition(tmp_path):
+    path = str(tmp_path / "next.jpg")
+    with Image.open(COVER) as img:
+        img = img.copy()
+    draw = ImageDraw.Draw(img)
+    draw.rectangle((40, 220, 420, 640), fill="white")
+    for y in range(240, 640, 60):
+        draw.rectangle((40, y, 400, y + 40), fill=(30, 30, 30))
+    img.save(path, "JPEG", quality=85)
+    return path
+
+def hashes_with(tmp_path, path, day):
+    hashes = CoverHashes(str(tmp_path / "hashes.npz"), str(tmp_path))
+    hashes.add("πρωινη", day, file_digest(path), cover_hash(path))
+    return hashes
+
+def check(hashes, path):
+    return hashes.seen("πρωινη", file_digest(path), cover_hash(path), TODAY)
+
+def test_identical_bytes_on_any_earlier_day(tmp_path):
+    hashes = hashes_with(tmp_path, COVER, TODAY - 30)
+    assert check(hashes, COVER) == (TODAY - 30, "exact")
+
+def test_reencoded_cover_within_the_window(tmp_path):
+    hashes = hashes_with(tmp_path, COVER, TODAY - 1)
+    assert check(hashes, reencoded(tmp_path)) == (TODAY - 1, "similar")
+
+def test_reencoded_cover_outside_the_window(tmp_path):
+    hashes = hashes_with(tmp_path, COVER, TODAY - 30)
+    assert check(hashes, reencoded(tmp_path)) is None
+
+def test_next_edition_is_not_stale(tmp_path):
+    hashes = hashes_with(tmp_path, COVER, TODAY - 1)
+    assert check(hashes, next_edition(tmp_path)) is None
+
+def test_other_title_is_not_compared(tmp_path):
+    hashes = hashes_with(tmp_path, COVER, TODAY - 1)
+    assert hashes.seen("αυγη", file_digest(COVER), cover_hash(COVER), TODAY) is None
+
+def test_scan_and_reload(tmp_path):
+    day_dir = tmp_path / "2026-10-15"
+    day_dir.mkdir()
+    shutil.copyfile(COVER, day_dir / "πρωινη_fp.jpg")
+    hashes = CoverHashes(str(tmp_path / "hashes.npz"), str(tmp_path))
+    assert check(hashes, COVER) == (TODAY - 1, "exact")
+    reloaded = CoverHashes(str(tmp_path / "hashes.npz"), str(tmp_path))
+    assert check(reloaded, reencoded(tmp_path)) == (TODAY - 1, "similar")
+
+def test_flag_only_by_default(bot):
+    assert bot.drop_stale is False